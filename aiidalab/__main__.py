@@ -4,8 +4,10 @@ from __future__ import annotations
 
 import json
 import logging
+import os
 import shutil
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager, nullcontext
 from dataclasses import asdict
 from fnmatch import fnmatch
@@ -52,21 +54,31 @@ def _spinner_with_message(
 def _list_apps(
     apps_path: Path,
 ) -> Generator[tuple[Path, str, _AiidaLabApp | None], None, None]:
-    if apps_path.is_dir():
-        for path in apps_path.iterdir():
-            if path.is_dir():
-                if path.stem.startswith(".") or path.stem == "__pycache__":
-                    continue  # exclude hidden directories and the Python cache directory.
-                app_name = str(path.relative_to(apps_path))
-                try:
-                    yield path, app_name, _AiidaLabApp.from_id(app_name)
-                except KeyError:
-                    yield path, app_name, None
-    elif apps_path.exists():
+    try:
+        # The directory entries provide the file type, which avoids a stat
+        # call for each entry.
+        with os.scandir(apps_path) as entries:
+            app_names = [
+                entry.name
+                for entry in entries
+                if entry.is_dir()
+                # exclude hidden directories and the Python cache directory.
+                and not (entry.name.startswith(".") or entry.name == "__pycache__")
+            ]
+    except FileNotFoundError:
+        return
+    except NotADirectoryError:
         raise click.ClickException(
             f"The apps path ('{apps_path}') appears to not be a valid directory."
         )
 
+    for app_name in app_names:
+        path = apps_path.joinpath(app_name)
+        try:
+            yield path, app_name, _AiidaLabApp.from_id(app_name)
+        except KeyError:
+            yield path, app_name, None
+
 
 @click.group(context_settings={"help_option_names": ["-h", "--help"]})
 @click.version_option(version=__version__, prog_name="AiiDAlab")
@@ -130,7 +142,7 @@ def search(app_query: str, prereleases: bool) -> None:
                 raise click.ClickException(str(error))
             app_requirements = [
                 Requirement(app_name)
-                for app_name in registry["apps"].keys()
+                for app_name in registry["apps"]
                 if fnmatch(app_name, app_query)
             ]
 
@@ -155,13 +167,20 @@ def _tabulate_apps(
     headers: tuple[str, str, str] = ("App name", "Version", "Path"),
     **kwargs: Any,
 ) -> Generator[str, None, None]:
-    rows = []
-    for app_path, app_name, app in sorted(apps):
+    def _format_version(app: _AiidaLabApp | None) -> str:
         if app is None:
-            version = ICON_DETACHED
-        else:
-            version = f"{app.installed_version()}{ICON_MODIFIED if app.dirty() else ''}"
-        rows.append([app_name, version, str(app_path)])
+            return ICON_DETACHED
+        return f"{app.installed_version()}{ICON_MODIFIED if app.dirty() else ''}"
+
+    # Determining the version requires inspecting the app repositories, which
+    # is I/O-bound and therefore done concurrently for all apps.
+    apps = sorted(apps)
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        versions = executor.map(_format_version, [app for _, _, app in apps])
+        rows = [
+            [app_name, version, str(app_path)]
+            for (app_path, app_name, _), version in zip(apps, versions)
+        ]
     yield tabulate(rows, headers=headers, colalign=("left", "left", "left"), **kwargs)
     if rows:
         yield f"\n{ICON_DETACHED}:detached {ICON_MODIFIED}:modified"
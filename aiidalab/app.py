@@ -11,6 +11,7 @@ import sys
 import tarfile
 import tempfile
 import threading
+from collections import deque
 from contextlib import contextmanager
 from dataclasses import asdict, dataclass, field
 from enum import Enum, Flag, auto
@@ -31,6 +32,7 @@ from watchdog.observers import Observer
 from watchdog.observers.polling import PollingObserver
 
 from .environment import Environment
+from .fetch import _write_response
 from .git_util import GitManagedAppRepo as Repo
 from .git_util import git_clone
 from .metadata import Metadata
@@ -93,7 +95,7 @@ class _AiidaLabApp:
     ) -> _AiidaLabApp:
         # Filter out invalid versions
         if releases := registry_entry.get("releases"):
-            versions = list(releases.keys())
+            versions = list(releases)
             for version in versions:
                 if not is_valid_version(version):
                     logger.warning(
@@ -411,6 +413,33 @@ class _AiidaLabApp:
             for name, requirement in unmatched_dependencies.items()
         ]
 
+    def _requirements_satisfied(self, requirements_file: Path, python_bin: str) -> bool:
+        """Check whether all requirements of a requirements file are installed.
+
+        Returns False if the file contains any lines that cannot be parsed
+        as requirements (e.g. pip options or URLs), requirements with extras,
+        or direct references (name @ url), since we cannot determine whether
+        those are satisfied without actually invoking pip.
+        """
+        from packaging.requirements import InvalidRequirement, Requirement
+
+        requirements = []
+        lines = requirements_file.read_text().splitlines()
+        for line in (line.strip() for line in lines):
+            if line and not line.startswith("#"):
+                try:
+                    requirement = Requirement(line)
+                except InvalidRequirement:
+                    return False
+                if requirement.extras or requirement.url:
+                    return False
+                requirements.append(requirement)
+
+        # Packages may have been changed since they were last listed, which is
+        # why they are listed again instead of relying on the cached list.
+        FIND_INSTALLED_PACKAGES_CACHE.clear()
+        return not any(self._find_incompatibilities_python(requirements, python_bin))
+
     def _install_dependencies(self, python_bin: str, stdout: Any) -> None:
         """Try to install the app dependencies with pip (if specified)."""
 
@@ -421,11 +450,14 @@ class _AiidaLabApp:
             # Install package dependencies.
             logger.info(f"Running 'pip install --user {' '.join(args)}'\n")
             process = run_pip_install(*args, python_bin=python_bin)
+            # Keep the tail of the output to report it in case of failure.
+            tail: deque[str] = deque(maxlen=20)
             for line in io.TextIOWrapper(process.stdout, encoding="utf-8"):
                 stdout.write(line)
+                tail.append(line)
             process.wait()
             if process.returncode != 0:
-                msg = "pip failed to install dependencies"
+                msg = "pip failed to install dependencies:\n" + "".join(tail)
                 raise RuntimeError(msg)
 
             # Restarting the AiiDA daemon to import newly installed plugins.
@@ -439,18 +471,29 @@ class _AiidaLabApp:
                 raise RuntimeError("Failed to restart verdi daemon.")
 
         for path in (self.path.joinpath(".aiidalab"), self.path):
-            if path.exists():
+            # Determine all files within the directory with a single scan
+            # instead of checking for each file individually.
+            try:
+                with os.scandir(path) as entries:
+                    files = {entry.name for entry in entries if entry.is_file()}
+            except (FileNotFoundError, NotADirectoryError):
+                continue
+            else:
                 try:
-                    if (
-                        path.joinpath("setup.py").is_file()
-                        or path.joinpath("pyproject.toml").is_file()
-                    ):
+                    if "setup.py" in files or "pyproject.toml" in files:
                         _pip_install(str(path), stdout=stdout)
-                    elif path.joinpath("requirements.txt").is_file():
-                        _pip_install(
-                            f"--requirement={path.joinpath('requirements.txt')}",
-                            stdout=stdout,
-                        )
+                    elif "requirements.txt" in files:
+                        if self._requirements_satisfied(
+                            path.joinpath("requirements.txt"), python_bin
+                        ):
+                            logger.info(
+                                f"All dependencies of app '{self.name}' are already satisfied."
+                            )
+                        else:
+                            _pip_install(
+                                f"--requirement={path.joinpath('requirements.txt')}",
+                                stdout=stdout,
+                            )
                     else:
                         logger.warning(
                             f"Warning: App '{self.name}' does not declare any dependencies."
@@ -507,12 +550,10 @@ class _AiidaLabApp:
                     self._install_from_path(Path(tmp_dir))
 
     def _install_from_https(self, url: str) -> None:
-        response = requests.get(url, stream=True)
-        response.raise_for_status()
-        content = response.content
-
         with tempfile.NamedTemporaryFile() as tmp_file:
-            tmp_file.write(content)
+            with requests.get(url, stream=True) as response:
+                response.raise_for_status()
+                _write_response(response, tmp_file)
             tmp_file.flush()
             self._install_from_path(Path(tmp_file.name))
 
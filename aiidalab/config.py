@@ -6,6 +6,7 @@ from typing import Any, Optional
 
 import click
 import toml
+from platformdirs import user_cache_dir
 
 CONFIG_PATH = Path.home() / "aiidalab.toml"
 _CONFIG = toml.loads(CONFIG_PATH.read_text()) if CONFIG_PATH.is_file() else {}
@@ -52,6 +53,7 @@ AIIDALAB_APPS = _get_config_value("apps", "/project/apps")
 AIIDALAB_REGISTRY = _get_config_value(
     "registry", "https://aiidalab.github.io/aiidalab-registry/api/v1"
 )
+AIIDALAB_CACHE = _get_config_value("cache", user_cache_dir("aiidalab"))
 # All the variables below are currently not used.
 # The README in the aiidalab-home home app states that AIIDALAB_HOME
 # is searched for SSH credentials, but that doesn't seem to be the case.
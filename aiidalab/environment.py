@@ -23,6 +23,7 @@ matching the order shown here:
 
 from __future__ import annotations
 
+import re
 from configparser import ConfigParser
 from dataclasses import dataclass, field
 from pathlib import Path
@@ -34,6 +35,18 @@ __all__ = [
     "Environment",
 ]
 
+# Fast path for extracting the (multi-line) install_requires option from the
+# [options] section of a setup.cfg file. Less common layouts are not matched
+# and are parsed with the ConfigParser instead.
+_INSTALL_REQUIRES_PATTERN = re.compile(
+    r"^\[options\][^\[]*?^(?i:install_requires)[ \t]*[=:][ \t]*\n((?:[ \t]*\n|[ \t]+.*\n?)+)",
+    re.MULTILINE,
+)
+
+# Matches values that the ConfigParser would modify, i.e., interpolate or strip
+# comment lines from, such that they cannot be taken from the fast path.
+_CONFIG_PARSER_SYNTAX_PATTERN = re.compile(r"%|^[ \t]*;", re.MULTILINE)
+
 
 @dataclass
 class Environment:
@@ -53,10 +66,19 @@ class Environment:
                 if line and not line.startswith("#"):
                     yield line
 
-        def _parse_setup_cfg(setup_cfg: str) -> Any:
+        def _parse_setup_cfg(setup_cfg: bytes) -> Any:
+            # Avoid the comparatively expensive construction of the config
+            # parser in case that the file does not specify any requirements.
+            # Option names are case-insensitive.
+            if b"install_requires" not in setup_cfg.lower():
+                raise KeyError("install_requires")
+            content = setup_cfg.decode()
+            match = _INSTALL_REQUIRES_PATTERN.search(content)
+            if match and not _CONFIG_PARSER_SYNTAX_PATTERN.search(match.group(1)):
+                return match.group(1)
             cfg = ConfigParser()
-            cfg.read_string(setup_cfg)
-            return cfg["options"].get("install_requires", None)
+            cfg.read_string(content)
+            return cfg["options"]["install_requires"]
 
         # Parse the setup.cfg file (if present).
         try:
@@ -64,7 +86,7 @@ class Environment:
                 "python_requirements",
                 list(
                     _parse_reqs(
-                        _parse_setup_cfg(path.joinpath("setup.cfg").read_text())
+                        _parse_setup_cfg(path.joinpath("setup.cfg").read_bytes())
                     )
                 ),
             )
@@ -1,62 +1,280 @@
 from __future__ import annotations
 
+import hashlib
+import json
 import logging
+import re
+import shutil
 import tarfile
 import tempfile
 import zipfile
-from contextlib import contextmanager
+from collections import Counter
+from contextlib import ExitStack, contextmanager
 from io import BytesIO
 from pathlib import Path
-from typing import Generator
+from threading import Lock
+from typing import IO, Generator
 from urllib.parse import urldefrag, urlsplit, urlunsplit
 
 import dulwich
 import requests
 
+from .config import AIIDALAB_CACHE
 from .git_util import GitPath, GitRepo
 
 logger = logging.getLogger(__name__)
 
+# Size of the chunks in which downloads are written to disk.
+_CHUNK_SIZE = 64 * 1024
+
+# Directory in which extracted archives are cached.
+_EXTRACTED_ARCHIVES_CACHE = Path(AIIDALAB_CACHE, "archives")
+
+# Maximum number of extracted archives kept in the cache.
+_EXTRACTED_ARCHIVES_CACHE_SIZE = 32
+
+# Number of users of each extracted archive, which must not be pruned while in use.
+_EXTRACTED_ARCHIVES_IN_USE: Counter[str] = Counter()
+_EXTRACTED_ARCHIVES_LOCK = Lock()
+
+_SHA256_PATTERN = re.compile(r"[0-9a-f]{64}")
+
 
 def _this_or_only_subdir(path: Path) -> Path:
     members = list(path.iterdir())
     return members[0] if len(members) == 1 and members[0].is_dir() else path
 
 
+def _extract_archive(archive: IO[bytes], path: Path) -> None:
+    try:
+        with tarfile.open(fileobj=archive) as tar_file:
+            tar_file.extractall(path=path)
+    except tarfile.ReadError as error:
+        logger.debug(str(error))
+        archive.seek(0)
+        try:
+            with zipfile.ZipFile(archive) as zip_file:
+                zip_file.extractall(path=path)
+        except zipfile.BadZipFile as error:
+            logger.debug(str(error))
+            raise RuntimeError("Failed to extract archive from file.")
+
+
+def _completion_marker(extracted: Path) -> Path:
+    return extracted.with_name(f"{extracted.name}.complete")
+
+
+def _is_extracted(extracted: Path) -> bool:
+    """Whether the archive was completely extracted into the cache."""
+    return _completion_marker(extracted).is_file() and extracted.is_dir()
+
+
+@contextmanager
+def _extracted_archive(name: str) -> Generator[Path, None, None]:
+    """Protect the cached extracted archive from being pruned while in use."""
+    with _EXTRACTED_ARCHIVES_LOCK:
+        _EXTRACTED_ARCHIVES_IN_USE[name] += 1
+    try:
+        yield _EXTRACTED_ARCHIVES_CACHE.joinpath(name)
+    finally:
+        with _EXTRACTED_ARCHIVES_LOCK:
+            _EXTRACTED_ARCHIVES_IN_USE[name] -= 1
+            if not _EXTRACTED_ARCHIVES_IN_USE[name]:
+                del _EXTRACTED_ARCHIVES_IN_USE[name]
+
+
+def _prune_extracted_archives_cache() -> None:
+    """Remove the least recently used extracted archives from the cache.
+
+    Archives that are currently in use are never removed.
+    """
+
+    def _last_used(path: Path) -> int:
+        try:
+            return path.stat().st_mtime_ns
+        except FileNotFoundError:  # concurrently removed
+            return 0
+
+    with _EXTRACTED_ARCHIVES_LOCK:
+        markers = sorted(
+            _EXTRACTED_ARCHIVES_CACHE.glob("*.complete"), key=_last_used, reverse=True
+        )
+        for marker in markers[_EXTRACTED_ARCHIVES_CACHE_SIZE:]:
+            extracted = marker.with_suffix("")
+            if _EXTRACTED_ARCHIVES_IN_USE[extracted.name]:
+                continue
+            # The marker is removed first, such that the entry is no longer used.
+            marker.unlink(missing_ok=True)
+            shutil.rmtree(extracted, ignore_errors=True)
+
+    # The validators of downloaded urls are bounded in the same way.
+    validators = sorted(
+        _EXTRACTED_ARCHIVES_CACHE.glob("urls/*.json"), key=_last_used, reverse=True
+    )
+    for path in validators[_EXTRACTED_ARCHIVES_CACHE_SIZE:]:
+        path.unlink(missing_ok=True)
+
+
+def _write_response(response: requests.Response, file: IO[bytes]) -> None:
+    """Write the body of a streamed response to file in chunks."""
+    for chunk in response.iter_content(chunk_size=_CHUNK_SIZE):
+        file.write(chunk)
+
+
+def _hash_archive(archive: IO[bytes]) -> str:
+    sha256 = hashlib.sha256()
+    for chunk in iter(lambda: archive.read(_CHUNK_SIZE), b""):
+        sha256.update(chunk)
+    return sha256.hexdigest()
+
+
+@contextmanager
+def _extract_to_cache(archive: IO[bytes]) -> Generator[Path, None, None]:
+    """Extract the archive into the cache and yield the extracted directory.
+
+    The directory is named after the hash of the archive, such that the same
+    archive is only extracted once. It is not pruned from the cache until the
+    context is exited.
+    """
+    with _extracted_archive(_hash_archive(archive)) as extracted:
+        marker = _completion_marker(extracted)
+        if _is_extracted(extracted):
+            marker.touch()  # mark as recently used
+            yield extracted
+            return
+
+        archive.seek(0)
+        _EXTRACTED_ARCHIVES_CACHE.mkdir(parents=True, exist_ok=True)
+        tmp_dir = Path(tempfile.mkdtemp(dir=_EXTRACTED_ARCHIVES_CACHE))
+        try:
+            _extract_archive(archive, tmp_dir)
+            with _EXTRACTED_ARCHIVES_LOCK:
+                # Otherwise, the archive was concurrently extracted.
+                if not _is_extracted(extracted):
+                    # Entries without completion marker are incomplete and replaced.
+                    shutil.rmtree(extracted, ignore_errors=True)
+                    try:
+                        # Renaming is atomic, i.e., the directory is only visible
+                        # once the archive is completely extracted.
+                        tmp_dir.rename(extracted)
+                    except OSError:
+                        if not extracted.is_dir():
+                            raise
+                        # Otherwise, it was concurrently extracted by another process.
+                    marker.touch()
+        finally:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+        _prune_extracted_archives_cache()
+        yield extracted
+
+
 @contextmanager
 def _fetch_from_path(path: Path | GitPath) -> Generator[Path | GitPath, None, None]:
     if path.is_dir():
         yield path
     else:
-        with tempfile.TemporaryDirectory() as tmp_dir:
+        with ExitStack() as stack:
+            with (
+                path.open("rb")
+                if isinstance(path, Path)
+                else BytesIO(path.read_bytes())
+            ) as archive:
+                extracted = stack.enter_context(_extract_to_cache(archive))
+            yield _this_or_only_subdir(extracted)
+
+
+def _validators_path(url: str) -> Path:
+    """Return the path at which the validators of a downloaded url are stored."""
+    url_hash = hashlib.sha256(url.encode()).hexdigest()
+    return _EXTRACTED_ARCHIVES_CACHE.joinpath("urls", f"{url_hash}.json")
+
+
+def _read_validators(url: str) -> dict[str, str] | None:
+    """Return the validators for a url if the archive is still cached.
+
+    Malformed validator files are treated as if they were missing.
+    """
+    try:
+        validators = json.loads(_validators_path(url).read_text())
+    except (FileNotFoundError, ValueError):
+        return None
+    if not (
+        isinstance(validators, dict)
+        and all(isinstance(value, str) for value in validators.values())
+        and _SHA256_PATTERN.fullmatch(validators.get("sha256", ""))
+    ):
+        return None
+    extracted = _EXTRACTED_ARCHIVES_CACHE.joinpath(validators["sha256"])
+    return validators if _is_extracted(extracted) else None
+
+
+def _write_validators(url: str, validators: dict[str, str]) -> None:
+    path = _validators_path(url)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # The file is replaced atomically, such that it is never read partially.
+    with tempfile.NamedTemporaryFile("w", dir=path.parent, delete=False) as file:
+        json.dump(validators, file)
+    Path(file.name).replace(path)
+
+
+@contextmanager
+def _download_to_cache(
+    url: str, response: requests.Response
+) -> Generator[Path, None, None]:
+    """Extract the downloaded archive into the cache and yield its directory."""
+    response.raise_for_status()
+    with ExitStack() as stack:
+        with tempfile.NamedTemporaryFile() as tmp_file:
+            _write_response(response, tmp_file)
+            tmp_file.seek(0)
             try:
-                with tarfile.open(fileobj=BytesIO(path.read_bytes())) as tar_file:
-                    tar_file.extractall(path=tmp_dir)
-                    yield _this_or_only_subdir(Path(tmp_dir))
-            except tarfile.ReadError as error:
-                logger.debug(str(error))
-                try:
-                    with zipfile.ZipFile(BytesIO(path.read_bytes())) as zip_file:
-                        zip_file.extractall(path=tmp_dir)
-                        yield _this_or_only_subdir(Path(tmp_dir))
-                except zipfile.BadZipFile as error:
-                    logger.debug(str(error))
-                    raise RuntimeError("Failed to extract archive from file.")
+                extracted = stack.enter_context(_extract_to_cache(tmp_file))
+            except RuntimeError as error:
+                raise RuntimeError(f"Unable to read from '{url}': {error}")
+
+        validators = {"sha256": extracted.name}
+        if "ETag" in response.headers:
+            validators["etag"] = response.headers["ETag"]
+        if "Last-Modified" in response.headers:
+            validators["last_modified"] = response.headers["Last-Modified"]
+        if len(validators) > 1:
+            _write_validators(url, validators)
+        yield extracted
 
 
 @contextmanager
 def _fetch_from_https(url: str) -> Generator[Path | GitPath, None, None]:
-    response = requests.get(url, stream=True)
-    response.raise_for_status()
-    content = response.content
-    with tempfile.NamedTemporaryFile() as tmp_file:
-        tmp_file.write(content)
-        tmp_file.flush()
-        try:
-            with _fetch_from_path(Path(tmp_file.name)) as path:
-                yield path
-        except RuntimeError as error:
-            raise RuntimeError(f"Unable to read from '{url}': {error}")
+    with ExitStack() as stack:
+        extracted = None
+
+        # Archives are only downloaded again if they changed since they were
+        # last downloaded. This requires that the server provides validators
+        # (ETag or Last-Modified) for them.
+        validators = _read_validators(url)
+        if validators is not None:
+            # The cached archive must not be pruned while it is revalidated.
+            cached = stack.enter_context(_extracted_archive(validators["sha256"]))
+            headers = {}
+            if "etag" in validators:
+                headers["If-None-Match"] = validators["etag"]
+            if "last_modified" in validators:
+                headers["If-Modified-Since"] = validators["last_modified"]
+            with requests.get(url, stream=True, headers=headers) as response:
+                if response.status_code != 304:
+                    extracted = stack.enter_context(_download_to_cache(url, response))
+                elif _is_extracted(cached):
+                    _completion_marker(cached).touch()  # mark as recently used
+                    extracted = cached
+                else:
+                    # The archive was removed from the cache in the meantime,
+                    # which is why it must be downloaded unconditionally.
+                    _validators_path(url).unlink(missing_ok=True)
+
+        if extracted is None:
+            with requests.get(url, stream=True) as response:
+                extracted = stack.enter_context(_download_to_cache(url, response))
+
+        yield _this_or_only_subdir(extracted)
 
 
 def _parse_git_url(git_url: str) -> tuple[str, str, str]:
@@ -73,7 +291,8 @@ def _fetch_from_git_https(git_url: str) -> Generator[Path | GitPath, None, None]
     url, rev, path = _parse_git_url(git_url)
 
     with tempfile.TemporaryDirectory() as tmp_dir:
-        repo = GitRepo.clone_from_url(url, tmp_dir)
+        # The full history is only needed if no specific rev is requested.
+        repo = GitRepo.clone_from_url(url, tmp_dir, None if rev == "HEAD" else rev)
         git_path = GitPath(repo.path, repo.ref_from_rev(rev)).joinpath(path)
         with _fetch_from_path(git_path) as tmp_path:
             yield tmp_path
@@ -15,16 +15,35 @@ from __future__ import annotations
 import locale
 import os
 import re
+import stat
+from contextlib import closing
 from dataclasses import dataclass
 from enum import Enum
-from pathlib import Path
+from pathlib import Path, PurePosixPath
 from subprocess import CalledProcessError, run
-from typing import Any, Generator
+from threading import RLock
+from typing import TYPE_CHECKING, Any, Generator, Sequence, cast
 from urllib.parse import urldefrag
 
-from dulwich.porcelain import branch_list, status
+from cachetools import LRUCache, cached
+from dulwich.config import ConfigFile
+from dulwich.errors import NotTreeError
+from dulwich.index import get_unstaged_changes
+from dulwich.object_store import tree_lookup_path
+from dulwich.objects import S_ISGITLINK, Commit, ShaFile, Tag
+from dulwich.objectspec import parse_commit
+from dulwich.porcelain import branch_list, get_tree_changes
+from dulwich.refs import SYMREF
 from dulwich.repo import Repo
 
+if TYPE_CHECKING:
+    from dulwich.objects import ObjectID
+    from dulwich.refs import Ref
+
+_HEAD = cast("Ref", b"HEAD")
+_REFS_HEADS = b"refs/heads/"
+_REFS_TAGS = cast("Ref", b"refs/tags/")
+
 
 class BranchTrackingStatus(Enum):
     """Descripe the tracking status of a branch."""
@@ -35,6 +54,48 @@ class BranchTrackingStatus(Enum):
     DIVERGED = 2
 
 
+def _history_key(repo: Repo, *commits: Any) -> tuple[Any, ...]:
+    """Return a cache key for results that depend on the history of commits.
+
+    Commits are immutable, however the history that is available in a shallow
+    repository changes when it is deepened, which is why the shallow commits
+    are part of the key.
+    """
+    return (repo.path, frozenset(repo.get_shallow()), *commits)
+
+
+@cached(cache=LRUCache(maxsize=128), key=_history_key, lock=RLock())
+def _get_tracking_status(
+    repo: Repo, local: ObjectID, remote: ObjectID
+) -> BranchTrackingStatus:
+    """Return the tracking status of a local commit with respect to a remote one."""
+    # Determine whether either commit has ancestors that are not reachable
+    # from the other one. The walks stop at the common ancestor, i.e., they
+    # do not traverse the shared history.
+    local_only = any(True for _ in repo.get_walker([local], exclude=[remote]))
+    remote_only = any(True for _ in repo.get_walker([remote], exclude=[local]))
+
+    if remote_only and not local_only:
+        return BranchTrackingStatus.BEHIND
+    elif local_only and not remote_only:
+        return BranchTrackingStatus.AHEAD
+    return BranchTrackingStatus.DIVERGED
+
+
+@cached(cache=LRUCache(maxsize=128), key=_history_key, lock=RLock())
+def _find_reachable_commits(
+    repo: Repo, tip: ObjectID, commits: frozenset[ObjectID]
+) -> frozenset[ObjectID]:
+    """Return the subset of commits that are reachable from the tip commit."""
+    # Walk the history only until all of the commits have been found.
+    pending = set(commits)
+    for entry in repo.get_walker([tip]):
+        pending.discard(entry.commit.id)
+        if not pending:
+            break
+    return commits - pending
+
+
 class GitManagedAppRepo(Repo):  # type: ignore
     """Utility class to simplify management of git-based apps."""
 
@@ -47,6 +108,11 @@ class GitManagedAppRepo(Repo):  # type: ignore
 
         Raises RuntimeError if the repository is in a detached HEAD state.
         """
+        # HEAD is typically a symbolic reference directly to the branch.
+        head: bytes | None = self.refs.read_ref(_HEAD)
+        if head is not None and head.startswith(SYMREF + _REFS_HEADS):
+            return head[len(SYMREF + _REFS_HEADS) :]
+
         branches = self._get_branch_for_ref(b"HEAD")
         if branches:
             return branches[0]
@@ -57,21 +123,33 @@ class GitManagedAppRepo(Repo):  # type: ignore
         if branch is None:
             branch = self.branch()
 
-        cfg = self.get_config()
+        # The config is shared by all worktrees and located in the common dir.
+        config_path = os.path.join(self.commondir(), "config")
+        try:
+            cfg = ConfigFile.from_path(config_path)
+        except FileNotFoundError:
+            return None
         try:
             remote = cfg[(b"branch", branch)][b"remote"]
             merge = cfg[(b"branch", branch)][b"merge"]
         except KeyError:
             return None
         else:
-            pattern = rb"refs\/heads"
-            remote_ref = b"refs/remotes/" + remote + re.sub(pattern, b"", merge)
+            remote_ref = b"refs/remotes/" + remote + merge.replace(b"refs/heads", b"")
             return remote_ref
 
     def dirty(self) -> bool:
         """Check if there are likely local user modifications to the app repository."""
-        status_ = status(self)
-        return bool(any(bool(_) for _ in status_.staged.values()) or status_.unstaged)
+        # Untracked files are not considered, which is why the (expensive)
+        # full status is not needed. The check for unstaged changes stops at
+        # the first modified file.
+        filter_callback = self.get_blob_normalizer().checkin_normalize
+        if any(
+            True
+            for _ in get_unstaged_changes(self.open_index(), self.path, filter_callback)
+        ):
+            return True
+        return any(bool(_) for _ in get_tree_changes(self).values())
 
     def update_available(self) -> bool:
         """Check whether there non-pulled commits on the tracked branch."""
@@ -86,38 +164,32 @@ class GitManagedAppRepo(Repo):  # type: ignore
         if tracked_branch:
             ref = b"refs/heads/" + branch
 
+            local, remote = self.refs[ref], self.refs[tracked_branch]
+
             # Check if local branch points to same commit as tracked branch:
-            if self.refs[ref] == self.refs[tracked_branch]:
+            if local == remote:
                 return BranchTrackingStatus.EQUAL
 
-            # Check if local branch is behind the tracked branch:
-            for commit in self.get_walker(self.refs[tracked_branch]):
-                if commit.commit.id == self.refs[ref]:
-                    return BranchTrackingStatus.BEHIND
-
-            # Check if local branch is ahead of tracked branch:
-            for commit in self.get_walker(self.refs[ref]):
-                if commit.commit.id == self.refs[tracked_branch]:
-                    return BranchTrackingStatus.AHEAD
-
-            return BranchTrackingStatus.DIVERGED
+            return _get_tracking_status(self, local, remote)
 
         return None
 
     def _get_branch_for_ref(self, ref: bytes) -> list[bytes]:
         """Get the branch name for a given reference."""
-        pattern = rb"refs\/heads\/"
         return [
-            re.sub(pattern, b"", ref)
+            ref[len(_REFS_HEADS) :]
             for ref in self.refs.follow(ref)[0]
-            if re.match(pattern, ref)
+            if ref.startswith(_REFS_HEADS)
         ]
 
 
 def git_clone(url, commit, path: Path):  # type: ignore
     try:
+        # Skip the checkout of the default branch if a specific commit is
+        # requested, since it would be replaced right away.
+        options = ["--no-checkout"] if commit is not None else []
         run(
-            ["git", "clone", str(url), str(path)],
+            ["git", "clone", *options, str(url), str(path)],
             capture_output=True,
             encoding="utf-8",
             check=True,
@@ -134,6 +206,110 @@ def git_clone(url, commit, path: Path):  # type: ignore
         raise RuntimeError(error.stderr)
 
 
+_COMMIT_ID_PATTERN = re.compile(r"[0-9a-f]{40}")
+
+
+def _rev_parse(repo: str, rev: str) -> str | None:
+    """Resolve the revision to a commit id with git or return None if unknown."""
+    result = run(
+        ["git", "rev-parse", "--verify", "--quiet", f"{rev}^{{commit}}"],
+        check=False,
+        cwd=repo,
+        capture_output=True,
+        encoding="utf-8",
+    )
+    return result.stdout.strip() if result.returncode == 0 else None
+
+
+def _lookup(repo: Repo, commit: str, path: str) -> tuple[int, bytes]:
+    """Look up the mode and the id of the object at path for the given commit.
+
+    Raises ValueError if the commit is unknown and FileNotFoundError if there
+    is no object at the given path.
+    """
+    obj: ShaFile
+    try:
+        obj = parse_commit(repo, commit)
+    except KeyError:
+        # dulwich does not understand revision expressions such as main~1,
+        # which is why git is used to resolve them as a fallback.
+        resolved = _rev_parse(repo.path, commit)
+        if resolved is None:
+            raise ValueError(f"Unknown commit: {commit}")
+        obj = repo[resolved.encode()]
+    while isinstance(obj, Tag):  # peel annotated tags
+        obj = repo[obj.object[1]]
+    if not isinstance(obj, Commit):
+        raise ValueError(f"Not a commit: {commit}")  # noqa: TRY004
+
+    parts = [part for part in PurePosixPath(path).parts if part != "."]
+    if not parts:
+        return stat.S_IFDIR, obj.tree
+    try:
+        mode, sha = tree_lookup_path(
+            repo.__getitem__, obj.tree, "/".join(parts).encode()
+        )
+    except (KeyError, NotTreeError):
+        raise FileNotFoundError(f"{commit}:{path}")
+    return mode, sha
+
+
+def _git_object_type(repo: str, commit: str, path: str) -> str | None:
+    """Return the type of the object at path for the given commit."""
+    with closing(Repo(repo)) as repo_:
+        try:
+            mode, _ = _lookup(repo_, commit, path)
+        except (ValueError, FileNotFoundError):
+            return None
+    if stat.S_ISDIR(mode):
+        return "tree"
+    elif S_ISGITLINK(mode):
+        return "commit"
+    return "blob"
+
+
+def _git_show(repo: str, commit: str, path: str) -> bytes:
+    """Return the content of the blob at path for the given commit.
+
+    Objects are read in-process with dulwich, with git only used as a
+    fallback for blobs that are not present in the local object store.
+    """
+    with closing(Repo(repo)) as repo_:
+        _, sha = _lookup(repo_, commit, path)
+        try:
+            data: bytes = repo_[sha].as_raw_string()
+        except KeyError:
+            pass
+        else:
+            return data
+    # The blob is not present in the local object store, which is the case
+    # for partial clones. Let git fetch it from the remote instead.
+    return run(
+        ["git", "show", f"{commit}:{path}"],
+        cwd=repo,
+        check=True,
+        capture_output=True,
+    ).stdout
+
+
+# Lookups are cached if they are guaranteed to be immutable.
+_GIT_OBJECT_TYPES: LRUCache[tuple[str, str, str], str] = LRUCache(maxsize=4096)
+_GIT_OBJECT_TYPES_LOCK = RLock()
+
+
+def _git_object_type_cached(repo: str, commit: str, path: str) -> str | None:
+    key = (repo, commit, path)
+    with _GIT_OBJECT_TYPES_LOCK:
+        object_type: str | None = _GIT_OBJECT_TYPES.get(key)
+    if object_type is None:
+        object_type = _git_object_type(repo, commit, path)
+        # Failed lookups are not cached, since the commit may be fetched later.
+        if object_type is not None:
+            with _GIT_OBJECT_TYPES_LOCK:
+                _GIT_OBJECT_TYPES[key] = object_type
+    return object_type
+
+
 @dataclass
 class GitPath(os.PathLike):  # type: ignore
     """Utility class to operate on git objects like path objects."""
@@ -142,8 +318,13 @@ class GitPath(os.PathLike):  # type: ignore
     commit: str
     path: Path = Path(".")
 
+    def __post_init__(self) -> None:
+        # The repository may be given as any path-like object, but is stored
+        # as Path, such that it does not need to be converted on every use.
+        self.repo = Path(self.repo)
+
     def __fspath__(self) -> str:
-        return str(Path(self.repo).joinpath(self.path))
+        return str(self.repo.joinpath(self.path))
 
     def joinpath(self, *other: str) -> GitPath:
         return type(self)(
@@ -151,35 +332,16 @@ class GitPath(os.PathLike):  # type: ignore
         )
 
     def resolve(self, strict: bool = False) -> GitPath:
+        root = self.repo.resolve()
         return type(self)(
             repo=self.repo,
-            path=Path(self.repo)
-            .joinpath(self.path)
-            .resolve(strict=strict)
-            .relative_to(Path(self.repo).resolve()),
+            path=root.joinpath(self.path).resolve(strict=strict).relative_to(root),
             commit=self.commit,
         )
 
     def _get_type(self) -> str | None:
-        # Git expects that a current directory path ("." or "./") is
-        # represented with a trailing slash for this function.
-        path = "./" if self.path == Path() else self.path
-
-        try:
-            return (
-                run(
-                    ["git", "cat-file", "-t", f"{self.commit}:{path}"],
-                    cwd=self.repo,
-                    check=True,
-                    capture_output=True,
-                )
-                .stdout.decode(errors="ignore")
-                .strip()
-            )
-        except CalledProcessError as error:
-            if error.returncode == 128:
-                return None
-            raise
+        get_type = _git_object_type_cached if self._immutable else _git_object_type
+        return get_type(os.fspath(self.repo), self.commit, str(self.path))
 
     def is_file(self) -> bool:
         return self._get_type() == "blob"
@@ -187,25 +349,27 @@ class GitPath(os.PathLike):  # type: ignore
     def is_dir(self) -> bool:
         return self._get_type() == "tree"
 
+    @property
+    def _immutable(self) -> bool:
+        """Whether the path refers to an object of a specific commit.
+
+        Objects are immutable if the commit is given by its id, as opposed
+        to a (moving) reference such as a branch name. Only then are type
+        lookup results safe to cache.
+        """
+        return _COMMIT_ID_PATTERN.fullmatch(self.commit) is not None
+
     def read_bytes(self) -> bytes:
         try:
-            return run(
-                ["git", "show", f"{self.commit}:{self.path}"],
-                cwd=os.fspath(self.repo),
-                check=True,
-                capture_output=True,
-            ).stdout
+            return _git_show(os.fspath(self.repo), self.commit, str(self.path))
         except CalledProcessError as error:
-            error_message = error.stderr.decode(errors="ignore").strip()
-            if re.match(
-                f"fatal: Path '{re.escape(str(self.path))}' (exists on disk, but not in|does not exist)",
-                error_message,
-                flags=re.IGNORECASE,
+            error_message = error.stderr.decode(errors="ignore").strip().lower()
+            if error_message.startswith(f"fatal: path '{self.path}'".lower()) and (
+                "exists on disk, but not in" in error_message
+                or "does not exist" in error_message
             ):
                 raise FileNotFoundError(f"{self.commit}:{self.path}")
-            elif re.match(
-                "fatal: Invalid object name", error_message, flags=re.IGNORECASE
-            ):
+            elif error_message.startswith("fatal: invalid object name"):
                 raise ValueError(f"Unknown commit: {self.commit}")
             else:
                 raise  # unexpected error
@@ -220,37 +384,44 @@ class GitPath(os.PathLike):  # type: ignore
 
 class GitRepo(Repo):  # type: ignore
     def get_current_branch(self) -> str | None:
-        try:
-            branch = run(
-                ["git", "branch", "--show-current"],
-                cwd=Path(self.path),
-                check=True,
-                capture_output=True,
-                encoding="utf-8",
-            ).stdout
-        except CalledProcessError as error:
-            if error.returncode == 129:
-                raise RuntimeError("This function equires at least git version 2.22.")
-            raise
-        if not branch:
-            raise RuntimeError(
-                "Unable to determine current branch name, likely in detached HEAD state."
-            )
-        return branch.strip()
+        # HEAD is typically a symbolic reference directly to the branch.
+        head: bytes | None = self.refs.read_ref(_HEAD)
+        if head is not None and head.startswith(SYMREF + _REFS_HEADS):
+            return head[len(SYMREF + _REFS_HEADS) :].decode()
+
+        refs: Sequence[bytes]
+        refs, _ = self.refs.follow(_HEAD)
+        for ref in refs:
+            if ref.startswith(_REFS_HEADS):
+                return ref[len(_REFS_HEADS) :].decode()
+        raise RuntimeError(
+            "Unable to determine current branch name, likely in detached HEAD state."
+        )
 
     def get_commit_for_tag(self, tag: str) -> Any:
         return self.get_peeled(f"refs/tags/{tag}".encode()).decode()
 
     def get_merged_tags(self, branch: str) -> Generator[str, None, None]:
+        for tag, _ in self.get_merged_tag_commits(branch):
+            yield tag
+
+    def get_merged_tag_commits(
+        self, branch: str
+    ) -> Generator[tuple[str, str], None, None]:
+        """Yield the tags merged into the branch together with their commits."""
         for branch_ref in [f"refs/heads/{branch}", f"refs/remotes/origin/{branch}"]:
-            if branch_ref.encode() in self.refs:
-                yield from run(
-                    ["git", "tag", "--merged", branch_ref],
-                    cwd=self.path,
-                    check=True,
-                    capture_output=True,
-                    encoding="utf-8",
-                ).stdout.splitlines()
+            ref = cast("Ref", branch_ref.encode())
+            if ref in self.refs:
+                tags = {
+                    tag: self.get_peeled(cast("Ref", _REFS_TAGS + tag))
+                    for tag in self.refs.keys(base=_REFS_TAGS)
+                }
+                merged = _find_reachable_commits(
+                    self, self.refs[ref], frozenset(tags.values())
+                )
+                for tag in sorted(tags):
+                    if tags[tag] in merged:
+                        yield tag.decode(), tags[tag].decode()
                 break
         else:
             raise ValueError(f"Not a branch: {branch}")
@@ -271,17 +442,41 @@ class GitRepo(Repo):  # type: ignore
         tag reference, otherwise the rev itself (assuming it is a commit id).
         """
 
-        if f"refs/heads/{rev}".encode() in self.refs:
-            return f"refs/heads/{rev}"
-        elif f"refs/remotes/origin/{rev}".encode() in self.refs:
-            return f"refs/remotes/origin/{rev}"
-        elif f"refs/tags/{rev}".encode() in self.refs:
-            return f"refs/tags/{rev}"
-        else:
-            return rev
+        for prefix in ("refs/heads/", "refs/remotes/origin/", "refs/tags/"):
+            ref = prefix + rev
+            if ref.encode() in self.refs:
+                return ref
+        return rev
 
     @classmethod
-    def clone_from_url(cls, url: str, path: str) -> GitRepo:
+    def clone_from_url(cls, url: str, path: str, rev: str | None = None) -> GitRepo:
+        """Clone the repository at url into path.
+
+        If a rev is provided, it is attempted to only clone the latest commit of
+        that specific branch or tag, since the history is not needed in that
+        case. Otherwise, or if that fails (e.g. because the rev is a commit id),
+        the full repository is cloned.
+        """
+        if rev is not None:
+            try:
+                run(
+                    [
+                        "git",
+                        "clone",
+                        "--depth=1",
+                        "--single-branch",
+                        f"--branch={rev}",
+                        urldefrag(url).url,
+                        path,
+                    ],
+                    cwd=Path(path).parent,
+                    check=True,
+                    capture_output=True,
+                )
+            except CalledProcessError:
+                pass  # git cleans up after a failed clone
+            else:
+                return GitRepo(path)
         run(
             ["git", "clone", urldefrag(url).url, path],
             cwd=Path(path).parent,
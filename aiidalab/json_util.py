@@ -0,0 +1,38 @@
+"""JSON (de)serialization helpers for AiiDAlab.
+
+The orjson package is optional, but significantly speeds up the
+(de)serialization of the app registry data if available.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any, Callable
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment, unused-ignore]
+
+
+def loads(data: bytes | str) -> Any:
+    """Deserialize JSON data.
+
+    The data is parsed directly, which avoids decoding bytes to str first.
+    """
+    if orjson is None:
+        return json.loads(data)
+    return orjson.loads(data)
+
+
+def dumps(obj: Any, default: Callable[[Any], Any] | None = None) -> bytes:
+    """Serialize obj to compact UTF-8 encoded JSON.
+
+    The output is identical with and without orjson installed.
+    """
+    if orjson is None:
+        return json.dumps(
+            obj, ensure_ascii=False, separators=(",", ":"), default=default
+        ).encode("utf-8")
+    data: bytes = orjson.dumps(obj, default=default)
+    return data
@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+import re
 from configparser import ConfigParser
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Generator
 
@@ -17,23 +19,26 @@ __all__ = [
 ]
 
 
+# Trove classifiers (PEP 301) mapped to aiidalab development states, in order
+# of precedence.
+_DEVELOPMENT_STATES = {
+    "Development Status :: 1 - Planning": "registered",
+    "Development Status :: 5 - Production/Stable": "stable",
+    "Development Status :: 2 - Pre-Alpha": "development",
+    "Development Status :: 3 - Alpha": "development",
+    "Development Status :: 4 - Beta": "development",
+}
+
+
 def _map_development_state(classifiers: str | list[str]) -> str:
     "Map standard trove classifiers (PEP 301) to aiidalab development states."
-    if "Development Status :: 1 - Planning" in classifiers:
-        return "registered"
-    elif "Development Status :: 5 - Production/Stable" in classifiers:
-        return "stable"
-    elif any(
-        classifier in classifiers
-        for classifier in (
-            "Development Status :: 2 - Pre-Alpha",
-            "Development Status :: 3 - Alpha",
-            "Development Status :: 4 - Beta",
-        )
-    ):
-        return "development"
-    else:
-        return "registered"
+    if isinstance(classifiers, str):
+        classifiers = classifiers.splitlines()
+    classifiers_ = {classifier.strip() for classifier in classifiers}
+    for classifier, state in _DEVELOPMENT_STATES.items():
+        if classifier in classifiers_:
+            return state
+    return "registered"
 
 
 def _parse_config_dict(dict_: str) -> Generator[tuple[str, str], None, None]:
@@ -48,8 +53,61 @@ def _parse_setup_cfg(
     setup_cfg: str,
 ) -> Generator[tuple[str, str | list[str]], None, None]:
     "Parse a setup.cfg configuration file string for metadata."
+    for key, value in _parse_setup_cfg_cached(setup_cfg):
+        # Lists are copied, since the cached result must not be modified.
+        yield key, list(value) if isinstance(value, list) else value
+
+
+# The same setup.cfg is typically parsed repeatedly, e.g., for multiple
+# releases of an app when building the registry.
+@lru_cache(maxsize=256)
+def _parse_setup_cfg_cached(
+    setup_cfg: str,
+) -> tuple[tuple[str, str | list[str]], ...]:
+    return tuple(_read_setup_cfg(setup_cfg))
+
+
+# Matches section headers in the same way as ConfigParser, however only if
+# they are not indented, i.e., they cannot be part of a multi-line value.
+_SECTION_HEADER_PATTERN = re.compile(r"^\[(.+)\]", re.MULTILINE)
+
+# Matches indented lines that ConfigParser treats as section headers unless
+# they continue a multi-line value.
+_INDENTED_SECTION_HEADER_PATTERN = re.compile(r"^[^\S\n]+\[.+\]", re.MULTILINE)
+
+
+def _select_sections(setup_cfg: str, sections: tuple[str, ...]) -> str:
+    """Return only the given sections of a configuration file string.
+
+    The whole string is returned if the sections cannot be selected without
+    changing the result of ConfigParser, e.g., if section headers are indented.
+    """
+    if _INDENTED_SECTION_HEADER_PATTERN.search(setup_cfg):
+        return setup_cfg
+    headers = list(_SECTION_HEADER_PATTERN.finditer(setup_cfg))
+    names = [header.group(1) for header in headers]
+    if not headers or len(set(names)) < len(names):
+        return setup_cfg  # ConfigParser rejects duplicate sections
+    for line in setup_cfg[: headers[0].start()].splitlines():
+        if line.strip() and not line.strip().startswith(("#", ";")):
+            return setup_cfg  # ConfigParser rejects values without a section
+    ends = [header.start() for header in headers[1:]] + [len(setup_cfg)]
+    return "".join(
+        setup_cfg[header.start() : end]
+        for header, end in zip(headers, ends)
+        if header.group(1) in sections
+    )
+
+
+def _read_setup_cfg(
+    setup_cfg: str,
+) -> Generator[tuple[str, str | list[str]], None, None]:
+    # Only the relevant sections are parsed, since the pure-Python ConfigParser
+    # is comparatively slow and setup.cfg files may contain many other sections.
     cfg = ConfigParser()
-    cfg.read_string(setup_cfg)
+    cfg.read_string(
+        _select_sections(setup_cfg, (cfg.default_section, "metadata", "aiidalab"))
+    )
 
     metadata_pep426: SectionProxy | dict[Any, Any] = (
         cfg["metadata"] if "metadata" in cfg else {}
@@ -110,15 +168,17 @@ class Metadata:
     @staticmethod
     def _parse(path: Path | GitPath) -> dict[str, Any]:
         try:
-            return {
-                key: value
-                for key, value in _parse_setup_cfg(
-                    path.joinpath("setup.cfg").read_text()
-                )
-                if value is not None
-            }
+            setup_cfg = path.joinpath("setup.cfg").read_bytes()
         except FileNotFoundError:
             return {}
+        # Files without any of the relevant sections need not be parsed.
+        if b"[metadata]" not in setup_cfg and b"[aiidalab]" not in setup_cfg:
+            setup_cfg = b""
+        return {
+            key: value
+            for key, value in _parse_setup_cfg(setup_cfg.decode("utf-8"))
+            if value is not None
+        }
 
     @classmethod
     def parse(cls, root: Path | GitPath) -> Metadata:
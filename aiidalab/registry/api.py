@@ -1,38 +1,61 @@
 """Generate API endpoints."""
 
-import json
+from concurrent.futures import ThreadPoolExecutor
 
 from .apps_index import validate_apps_index_and_apps
+from .util import dump_json, dumps_json, load_json, loads_json
 
 
-def build_api_v1(api_path, apps_index, apps_data):
-    """Build tree for API endpoint v1."""
+def build_api_v1(api_path, apps_index, apps_data, schemas=None):
+    """Build tree for API endpoint v1.
+
+    If schemas are provided, the serialized apps data is validated before it
+    is written, which avoids reading the app files back in validate_api_v1().
+    """
+    # The apps data is serialized upfront, such that exactly the written bytes
+    # are validated.
+    apps_json = {app_id: dumps_json(app_data) for app_id, app_data in apps_data.items()}
+    if schemas is not None:
+        for app_json in apps_json.values():
+            schemas.validators["app"].validate(loads_json(app_json))
 
     # Create base path if necessary.
     api_path.mkdir(parents=True, exist_ok=True)
 
     # Write apps_index.json file.
     outfile = api_path / "apps_index.json"
-    rendered = json.dumps(apps_index, ensure_ascii=False)
-    outfile.write_text(rendered, encoding="utf-8")
+    dump_json(apps_index, outfile)
     yield outfile
 
-    api_path.joinpath("apps").mkdir()
-    for app_id, app_data in apps_data.items():
+    apps_path = api_path.joinpath("apps")
+    apps_path.mkdir()
+
+    def _write_app_data(app_id):
         # Write apps/{appId}.json
-        outfile = api_path / "apps" / f"{app_id}.json"
-        rendered = json.dumps(app_data, ensure_ascii=False)
-        outfile.write_text(rendered, encoding="utf-8")
-        yield outfile
-
-
-def validate_api_v1(api_path, schemas):
-    """Validate tree for API endpoint v1."""
-    apps_index = json.loads(api_path.joinpath("apps_index.json").read_text())
-    apps = [
-        json.loads(api_path.joinpath("apps", f"{app_id}.json").read_text())
-        for app_id in apps_index["apps"]
-    ]
+        outfile = apps_path.joinpath(f"{app_id}.json")
+        outfile.write_bytes(apps_json[app_id])
+        return outfile
+
+    # The app files are independent of each other and written concurrently.
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        yield from executor.map(_write_app_data, apps_json)
+
+
+def validate_api_v1(api_path, schemas, include_apps=True):
+    """Validate tree for API endpoint v1.
+
+    Set include_apps to False to only validate the apps index, e.g., when the
+    apps data was already validated while building the tree.
+    """
+    apps_index = load_json(api_path.joinpath("apps_index.json"))
+    apps = (
+        [
+            load_json(api_path.joinpath("apps", f"{app_id}.json"))
+            for app_id in apps_index["apps"]
+        ]
+        if include_apps
+        else []
+    )
     validate_apps_index_and_apps(
         apps_index,
         apps_index_schema=schemas.apps_index,
@@ -1,8 +1,7 @@
 """Generate the apps index including all aggregated metadata."""
 
 import logging
-from collections import OrderedDict
-from copy import deepcopy
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import asdict
 
 import jsonschema
@@ -21,23 +20,32 @@ def _determine_app_name(app_id):
 
 
 def _migrate_app_data(app_data):
+    """Return the app data migrated to the current format.
+
+    The app data is not modified in place, but only copied where needed.
+    """
+    app_data = dict(app_data)
     if "metadata" in app_data:
+        metadata = dict(app_data["metadata"])
+
         # Set defaults
-        app_data["metadata"].setdefault("categories", app_data.pop("categories", []))
-        app_data["metadata"].setdefault("logo", app_data.pop("logo", None))
+        metadata.setdefault("categories", app_data.pop("categories", []))
+        metadata.setdefault("logo", app_data.pop("logo", None))
 
         # Remove deprecated keys from app metadata.
         for key in (
             "requires",
             "version",
         ):
-            if key in app_data["metadata"]:
-                del app_data["metadata"][key]
+            metadata.pop(key, None)
+
+        app_data["metadata"] = metadata
+    return app_data
 
 
 def _fetch_app_data(app_id, app_data, scan_app_repository):
     # Gather all release data.
-    _migrate_app_data(app_data)
+    app_data = _migrate_app_data(app_data)
 
     app_data["name"] = _determine_app_name(app_id)
     app_data["releases"] = {
@@ -59,28 +67,45 @@ def generate_apps_index(data, scan_app_repository):
     such as the releases.
     """
 
-    apps_data = OrderedDict()
-    index = {
-        "apps": OrderedDict(),
-        "categories": data.categories,
-    }
     logger.info("Fetching app data...")
 
-    for app_id in sorted(data.apps.keys()):
+    def _fetch(app_id):
         logger.info(f"  - {app_id}")
-        app_data = _fetch_app_data(
-            app_id, deepcopy(data.apps[app_id]), scan_app_repository
-        )
-        if app_data is not None:  # would be None if the app had no release yet.
-            apps_data[app_id] = app_data
-            index["apps"][app_id] = {
+        return _fetch_app_data(app_id, data.apps[app_id], scan_app_repository)
+
+    # Fetching the app data is dominated by network I/O (e.g. cloning the app
+    # repositories), which is why the apps are fetched concurrently.
+    app_ids = sorted(data.apps)
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        fetched_apps_data = list(executor.map(_fetch, app_ids))
+
+    # Plain dicts preserve the (sorted) insertion order of the app ids.
+    apps_data = {
+        app_id: app_data
+        for app_id, app_data in zip(app_ids, fetched_apps_data)
+        if app_data is not None  # would be None if the app had no release yet.
+    }
+    index = {
+        "apps": {
+            app_id: {
                 "name": app_data["name"],
                 "categories": app_data["metadata"].get("categories", []),
             }
+            for app_id, app_data in apps_data.items()
+        },
+        "categories": data.categories,
+    }
 
     return index, apps_data
 
 
+def validate_apps(apps, app_schema):
+    """Validate all apps against the app schema."""
+    validator = util.get_validator(app_schema)
+    for app in apps:
+        validator.validate(app)
+
+
 def validate_apps_index_and_apps(apps_index, apps_index_schema, apps, app_schema):
     """Validate the apps_index file."""
 
@@ -93,5 +118,4 @@ def validate_apps_index_and_apps(apps_index, apps_index_schema, apps, app_schema
             assert category in apps_index["categories"]
 
     # Validate all apps
-    for app in apps:
-        jsonschema.validate(instance=app, schema=app_schema)
+    validate_apps(apps, app_schema)
@@ -1,12 +1,19 @@
 """Core data classes for the app registry."""
 
-import json
 from dataclasses import dataclass, fields
+from functools import cached_property, lru_cache
+from importlib.resources import files
 
-import jsonschema
-import pkg_resources
+from .util import get_validator, load_json
 
-from .util import load_json
+
+@lru_cache(maxsize=None)
+def _load_package_schema(name):
+    """Load a schema shipped with the package.
+
+    The returned schema is shared between all callers and must not be modified.
+    """
+    return load_json(files(__package__).joinpath(f"schemas/{name}.schema.json"))
 
 
 @dataclass
@@ -20,6 +27,14 @@ class AppRegistrySchemas:
     environment: dict
     metadata: dict
 
+    @cached_property
+    def validators(self):
+        """Validators for all schemas, which are created only once."""
+        return {
+            field.name: get_validator(getattr(self, field.name))
+            for field in fields(self)
+        }
+
     @classmethod
     def from_path(cls, path):
         return cls(
@@ -32,14 +47,7 @@ class AppRegistrySchemas:
     @classmethod
     def from_package(cls):
         return cls(
-            **{
-                field.name: json.loads(
-                    pkg_resources.resource_string(
-                        "aiidalab.registry", f"schemas/{field.name}.schema.json"
-                    )
-                )
-                for field in fields(cls)
-            }
+            **{field.name: _load_package_schema(field.name) for field in fields(cls)}
         )
 
 
@@ -52,5 +60,5 @@ class AppRegistryData:
 
     def validate(self, schemas: AppRegistrySchemas):
         """Validate the registry data against the provided registry schemas."""
-        jsonschema.validate(instance=self.apps, schema=schemas.apps)
-        jsonschema.validate(instance=self.categories, schema=schemas.categories)
+        schemas.validators["apps"].validate(self.apps)
+        schemas.validators["categories"].validate(self.categories)
@@ -1,35 +1,54 @@
 """Generate the app registry website HTML pages."""
 
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from pathlib import Path
 
 from jinja2 import (
     ChoiceLoader,
     Environment,
+    FileSystemBytecodeCache,
     FileSystemLoader,
     PackageLoader,
     select_autoescape,
 )
 
+from ..config import AIIDALAB_CACHE
 from ..utils import sort_semantic
 
+# Directory in which the compiled templates are cached across builds.
+_TEMPLATES_BYTECODE_CACHE = Path(AIIDALAB_CACHE, "templates")
 
-def build_html(base_path, apps_index, apps_data, templates_path):
-    """Generate the app registry website at the base_path path."""
 
-    # Create base_path directory if needed
-    base_path.mkdir(parents=True, exist_ok=True)
+@lru_cache(maxsize=8)
+def _get_environment(templates_path, bytecode_cache_path):
+    """Return the template environment, which is set up once per templates path.
 
-    # Setup template environment
+    The environment caches the compiled templates in memory, and the bytecode
+    cache in bytecode_cache_path keeps them across builds.
+    """
     loaders = [PackageLoader(__name__)]
     if templates_path:
         loaders.insert(0, FileSystemLoader(templates_path))
 
+    bytecode_cache_path.mkdir(parents=True, exist_ok=True)
     env = Environment(
         loader=ChoiceLoader(loaders),
         autoescape=select_autoescape(["html", "xml"]),
+        bytecode_cache=FileSystemBytecodeCache(str(bytecode_cache_path)),
     )
     env.filters["sort_semantic"] = sort_semantic
+    return env
+
 
+def build_html(base_path, apps_index, apps_data, templates_path):
+    """Generate the app registry website at the base_path path."""
+
+    # Create base_path directory if needed
+    base_path.mkdir(parents=True, exist_ok=True)
+
+    env = _get_environment(templates_path, _TEMPLATES_BYTECODE_CACHE)
     app_page_template = env.get_template("app_page.html")
     main_index_template = env.get_template("index.html")
 
@@ -37,23 +56,28 @@ def build_html(base_path, apps_index, apps_data, templates_path):
     base_path.joinpath("apps").mkdir()
     html_template_data = defaultdict(dict)
 
+    def _write_subpage(app_id):
+        subpage = base_path.joinpath("apps", app_id, "index.html")
+        subpage.parent.mkdir()
+        # Stream the rendered page directly into the file.
+        with subpage.open("wb") as file:
+            app_page_template.stream(
+                category_map=apps_index["categories"], **html_template_data[app_id]
+            ).dump(file, encoding="utf-8")
+        return subpage
+
     for app_id in apps_index["apps"]:
         subpage = base_path.joinpath("apps", app_id, "index.html")
         html_template_data[app_id]["subpage"] = str(subpage.relative_to(base_path))
         html_template_data[app_id]["metadata"] = apps_data[app_id]["metadata"]
         html_template_data[app_id]["releases"] = apps_data[app_id]["releases"]
 
-        subpage.parent.mkdir()
-        subpage.write_text(
-            app_page_template.render(
-                category_map=apps_index["categories"], **html_template_data[app_id]
-            ),
-            encoding="utf-8",
-        )
-        yield subpage
+    # The subpages are independent of each other and rendered concurrently.
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        yield from executor.map(_write_subpage, apps_index["apps"])
 
     # Make index page based on main_index.html
-    rendered = main_index_template.render(apps=html_template_data)
     outfile = base_path / "index.html"
-    outfile.write_text(rendered, encoding="utf-8")
+    with outfile.open("wb") as file:
+        main_index_template.stream(apps=html_template_data).dump(file, encoding="utf-8")
     yield outfile
@@ -21,6 +21,7 @@ class Release:
 
 
 RELEASE_LINE_PATTERN = r"^(?P<rev>[^:]*?)(:(?P<rev_selection>.*))?$"
+_RELEASE_LINE_RE = re.compile(RELEASE_LINE_PATTERN)
 
 
 def _split_release_line(url):
@@ -61,10 +62,9 @@ def _get_tags(repo: GitRepo, branch: str, rev_selection: str):
     # contains the branch ref. For example `v1..` is expanded to
     # `v1..{ref}`, where `{ref}` is replaced with the actual reference.
     start, _, stop = rev_selection.rpartition("..")
-    selected_commits = repo.rev_list(f"{start or ref}..{stop or ref}")
+    selected_commits = set(repo.rev_list(f"{start or ref}..{stop or ref}"))
 
-    for tag in repo.get_merged_tags(branch):
-        commit = repo.get_commit_for_tag(tag)
+    for tag, commit in repo.get_merged_tag_commits(branch):
         if commit in selected_commits:
             yield tag, commit
 
@@ -76,7 +76,7 @@ def _get_release_commits(repo: GitRepo, release_line: str):
     :param release_line: support standard git revision selection syntax to further
         reduce the selected commits on a release line. For example, @main:v1.0.0.. means “select all tagged commits on the main branch after commit tagged with v1.0.0”.
     """
-    match = re.match(RELEASE_LINE_PATTERN, release_line)
+    match = _RELEASE_LINE_RE.match(release_line)
 
     if not match:
         raise ValueError(f"Invalid release line specification: {release_line}")
@@ -87,9 +87,9 @@ def _get_release_commits(repo: GitRepo, release_line: str):
         # loop over all remote branches and yield the tags for the commits
 
         tags = set()
-        for branch in repo.refs.as_dict(b"refs/remotes/origin/").keys():
+        rev_selection = match.groupdict()["rev_selection"]
+        for branch in repo.refs.as_dict(b"refs/remotes/origin/"):
             rev = branch.decode()
-            rev_selection = match.groupdict()["rev_selection"]
 
             for tag, commit in _get_tags(repo, rev, rev_selection):
                 if tag not in tags:
@@ -102,13 +102,14 @@ def _get_release_commits(repo: GitRepo, release_line: str):
         # No rev_selection means to select this and only this specific
         # revision.  For example: '@main' means, simply checkout 'main' (could
         # be a branch or a tag, however branches have priority).
-        for ref in [
-            f"refs/heads/{rev}",
-            f"refs/remotes/origin/{rev}",
-            f"refs/tags/{rev}",
-        ]:
-            if ref.encode() in repo.refs:
-                yield rev, repo.get_peeled(ref.encode()).decode()
+        refs = repo.refs
+        for ref in (
+            f"refs/heads/{rev}".encode(),
+            f"refs/remotes/origin/{rev}".encode(),
+            f"refs/tags/{rev}".encode(),
+        ):
+            if ref in refs:
+                yield rev, repo.get_peeled(ref).decode()
                 return
         # rev likely committish (commit)
         yield rev, rev
@@ -127,8 +128,7 @@ def _get_release_commits(repo: GitRepo, release_line: str):
         # The rev selection is empty, select all tagged commits for the
         # selected revision.  For example: '@main:' means all tagged commits on
         # the main branch.
-        for tag in repo.get_merged_tags(rev):
-            yield tag, repo.get_commit_for_tag(tag)
+        yield from repo.get_merged_tag_commits(rev)
 
 
 def _gather_releases(release_specs, scan_app_repository, app_metadata):
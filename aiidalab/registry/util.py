@@ -1,10 +1,14 @@
 """Utility functions for the application registry."""
 
-import json
+import re
 import string
 from pathlib import Path
 from urllib.parse import urlparse
 
+import jsonschema
+
+from .. import json_util
+
 
 def get_html_app_fname(app_name):
     valid_characters = set(string.ascii_letters + string.digits + "_-")
@@ -14,8 +18,13 @@ def get_html_app_fname(app_name):
     return f"{simple_string}.html"
 
 
+# Matches the network location of well-formed urls, e.g., https://host/path.
+_NETLOC_PATTERN = re.compile(r"^[A-Za-z][A-Za-z0-9+.-]*://([^/?#]*)")
+
+
 def get_hosted_on(url):
-    netloc = urlparse(url).netloc
+    match = _NETLOC_PATTERN.match(url)
+    netloc = match.group(1) if match else urlparse(url).netloc
 
     # Remove port (if any)
     netloc = netloc.partition(":")[0]
@@ -27,5 +36,38 @@ def get_hosted_on(url):
     return netloc
 
 
+def get_validator(schema):
+    """Return a validator for the given schema, which is checked only once.
+
+    Unlike jsonschema.validate(), the returned validator can be reused for
+    many instances without re-checking the schema for each of them.
+    """
+    cls = jsonschema.validators.validator_for(schema)
+    cls.check_schema(schema)
+    return cls(schema)
+
+
+def loads_json(data: bytes) -> dict:
+    return json_util.loads(data)
+
+
 def load_json(path: Path) -> dict:
-    return json.loads(path.read_text())
+    return loads_json(path.read_bytes())
+
+
+def _resolve_proxy(obj):
+    """Resolve lazy proxy objects such as the ones created by jsonref."""
+    try:
+        return obj.__subject__
+    except AttributeError:
+        raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps_json(obj) -> bytes:
+    """Serialize obj to UTF-8 encoded JSON."""
+    return json_util.dumps(obj, default=_resolve_proxy)
+
+
+def dump_json(obj, path: Path) -> None:
+    """Write obj as UTF-8 encoded JSON to path."""
+    path.write_bytes(dumps_json(obj))
@@ -2,14 +2,12 @@
 
 import logging
 import os
-import os.path
 import shutil
+from importlib import resources
 from itertools import chain
 from pathlib import Path
 from typing import Optional
 
-import pkg_resources
-
 from ..utils import parse_app_repo
 from . import api, yaml
 from .apps_index import generate_apps_index
@@ -34,30 +32,22 @@ def copy_static_tree_from_path(base_path, static_path):
             yield dst
 
 
-def _walk_pkg_resources(package, root):
-    paths = pkg_resources.resource_listdir(package, root)
-    for path in paths:
-        dir_paths = [
-            path
-            for path in paths
-            if pkg_resources.resource_isdir(package, os.path.join(root, path))
-        ]
-        yield root, list(set(paths).difference(dir_paths))
-        for dir_path in dir_paths:
-            yield from _walk_pkg_resources(package, os.path.join(root, dir_path))
+def _walk_package_tree(traversable, path):
+    for entry in traversable.iterdir():
+        if entry.is_dir():
+            yield from _walk_package_tree(entry, path / entry.name)
+        else:
+            yield path / entry.name, entry
 
 
 def copy_static_tree_from_package(html_path, root="static"):
-    for directory, files in _walk_pkg_resources(__package__, root):
-        stem = html_path.joinpath(Path(directory).relative_to(root))
-        stem.mkdir(parents=True, exist_ok=True)
-        for fn in files:
-            src = pkg_resources.resource_stream(
-                __package__, os.path.join(directory, fn)
-            )
-            dst = stem.joinpath(fn)
-            dst.write_bytes(src.read())
-            yield dst
+    for path, src in _walk_package_tree(
+        resources.files(__package__).joinpath(root), Path()
+    ):
+        dst = html_path.joinpath(path)
+        dst.parent.mkdir(parents=True, exist_ok=True)
+        dst.write_bytes(src.read_bytes())
+        yield dst
 
 
 def build(
@@ -122,6 +112,7 @@ def build(
                 api_path=base_path / api_path,
                 apps_index=apps_index,
                 apps_data=apps_data,
+                schemas=schemas if validate_output else None,
             )
             if api_path
             else ()
@@ -131,4 +122,7 @@ def build(
 
     if validate_output:
         if api_path:
-            api.validate_api_v1(api_path=base_path / api_path, schemas=schemas)
+            # The serialized apps data was already validated during the build.
+            api.validate_api_v1(
+                api_path=base_path / api_path, schemas=schemas, include_apps=False
+            )
@@ -9,7 +9,7 @@ import sys
 import time
 from collections import defaultdict
 from dataclasses import asdict
-from functools import wraps
+from functools import lru_cache, wraps
 from pathlib import Path
 from subprocess import run
 from threading import Lock
@@ -20,6 +20,7 @@ import requests
 from cachetools import TTLCache, cached
 from packaging.utils import NormalizedName, canonicalize_name
 
+from . import json_util
 from .config import AIIDALAB_REGISTRY
 from .environment import Environment
 from .fetch import fetch_from_url
@@ -27,6 +28,7 @@ from .metadata import Metadata
 
 if TYPE_CHECKING:
     from packaging.requirements import Requirement
+    from packaging.version import Version
 
 logger = logging.getLogger(__name__)
 FIND_INSTALLED_PACKAGES_CACHE = TTLCache(maxsize=32, ttl=60)  # type: ignore
@@ -57,7 +59,9 @@ except ImportError:
 def load_app_registry_index() -> Any:
     """Load apps' information from the AiiDAlab registry."""
     try:
-        return _session.get(f"{AIIDALAB_REGISTRY}/apps_index.json").json()
+        return json_util.loads(
+            _session.get(f"{AIIDALAB_REGISTRY}/apps_index.json").content
+        )
     except (ValueError, requests.ConnectionError) as error:
         raise RuntimeError("Unable to load registry index") from error
 
@@ -65,7 +69,9 @@ def load_app_registry_index() -> Any:
 def load_app_registry_entry(app_id: str) -> Any:
     """Load registry entry for app with app_id."""
     try:
-        return _session.get(f"{AIIDALAB_REGISTRY}/apps/{app_id}.json").json()
+        return json_util.loads(
+            _session.get(f"{AIIDALAB_REGISTRY}/apps/{app_id}.json").content
+        )
     except (ValueError, requests.ConnectionError):
         logger.debug(f"Unable to load registry entry for app with id '{app_id}'.")
         return None
@@ -214,12 +220,20 @@ def get_package_by_name(packages: dict[str, Package], name: str) -> Package | No
     return None
 
 
+@lru_cache(maxsize=4096)
+def _parse_version(version: str) -> Version:
+    """Parse a version string, caching the result since versions recur often."""
+    from packaging.version import parse
+
+    return parse(version)
+
+
 def is_valid_version(version: str) -> bool:
     """Return True if given string is a PEP440-compliant version, False otherwise."""
-    from packaging.version import InvalidVersion, parse
+    from packaging.version import InvalidVersion
 
     try:
-        parse(version)
+        _parse_version(version)
     except InvalidVersion:
         return False
     else:
@@ -236,12 +250,15 @@ def sort_semantic(
 
     :raises: packaging.version.InvalidVersion if the input list contains invalid version.
     """
-    from packaging.version import parse
-
+    parsed_versions = sorted(
+        ((_parse_version(version), version) for version in versions),
+        key=lambda item: item[0],
+        reverse=reverse,
+    )
     return [
         version
-        for version in sorted(versions, key=parse, reverse=reverse)
-        if prereleases or not parse(version).is_prerelease
+        for parsed_version, version in parsed_versions
+        if prereleases or not parsed_version.is_prerelease
     ]
 
 
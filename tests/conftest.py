@@ -1,5 +1,6 @@
 import sys
 from pathlib import Path
+from subprocess import run
 
 import pytest
 from ruamel.yaml import YAML
@@ -99,6 +100,72 @@ def forbid_external_commands(monkeypatch):
     )
 
 
+def _git(*args, cwd):
+    return run(
+        ["git", *args], cwd=cwd, check=True, capture_output=True, encoding="utf-8"
+    ).stdout.strip()
+
+
+@pytest.fixture
+def git(monkeypatch):
+    """Return a function to run git commands with a fixed identity."""
+    for role in ("AUTHOR", "COMMITTER"):
+        monkeypatch.setenv(f"GIT_{role}_NAME", "AiiDAlab")
+        monkeypatch.setenv(f"GIT_{role}_EMAIL", "aiidalab@example.com")
+    return _git
+
+
+@pytest.fixture
+def commit_file(git):
+    """Return a function to add and commit a new file to a git repository."""
+
+    def _commit_file(path, name):
+        path.joinpath(name).write_text(name)
+        git("add", name, cwd=path)
+        git("commit", "-m", f"Add {name}", cwd=path)
+
+    return _commit_file
+
+
+@pytest.fixture
+def git_repo_path(tmp_path, git):
+    """Create a git repository with a single commit tagged as v1.0.0."""
+    path = tmp_path / "repo"
+    path.mkdir()
+    git("init", "--initial-branch=main", cwd=path)
+    path.joinpath("setup.cfg").write_text("[metadata]\nname = test\n")
+    path.joinpath("src").mkdir()
+    path.joinpath("src", "module.py").write_text("")
+    git("add", ".", cwd=path)
+    git("commit", "-m", "Initial commit", cwd=path)
+    git("tag", "v1.0.0", cwd=path)
+    return path
+
+
+@pytest.fixture
+def app_repo_path(git_repo_path, tmp_path, git):
+    """Clone the git repository as it would be for an installed app."""
+    path = tmp_path / "app"
+    git("clone", str(git_repo_path), str(path), cwd=tmp_path)
+    return path
+
+
+@pytest.fixture(autouse=True, scope="function")
+def extracted_archives_cache(monkeypatch, tmp_path):
+    """Extract archives into a temporary cache directory during tests."""
+    path = tmp_path / "archives"
+    monkeypatch.setattr("aiidalab.fetch._EXTRACTED_ARCHIVES_CACHE", path)
+    return path
+
+
+@pytest.fixture(autouse=True, scope="function")
+def templates_bytecode_cache(monkeypatch, tmp_path):
+    """Cache the compiled registry templates in a temporary directory during tests."""
+    path = tmp_path / "templates"
+    monkeypatch.setattr("aiidalab.registry.html._TEMPLATES_BYTECODE_CACHE", path)
+    return path
+
+
 @pytest.fixture
 def installed_packages(monkeypatch):
     """change the return of pip_list.
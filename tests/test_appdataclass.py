@@ -215,3 +215,56 @@ def test_compatibility_check_with_local_repo_if_detached(
         lambda _: Environment(python_requirements=["aiida-core~=3.0"]),
     )
     assert len(list(aiidalab_app_data.find_incompatibilities("v0.1.0"))) == 1
+
+
+@pytest.mark.parametrize(
+    "requirements,satisfied",
+    [
+        ("aiida-core~=2.0\n# comment\njupyter_client>=7\n", True),
+        ("aiida-core~=3.0\n", False),
+        ("numpy\n", False),
+        ("aiida-core[atomic_tools]~=2.0\n", False),
+        ("aiida-core @ https://example.com/aiida_core-2.2.1.whl\n", False),
+        ("--index-url=https://example.com\naiida-core~=2.0\n", False),
+    ],
+)
+def test_requirements_satisfied(
+    tmp_path, installed_packages, python_bin, requirements, satisfied
+):
+    """Test that pip is only needed if requirements are not already satisfied."""
+    requirements_file = tmp_path / "requirements.txt"
+    requirements_file.write_text(requirements)
+
+    aiidalab_app_data = _AiidaLabApp(
+        metadata={},
+        name="test",
+        path=tmp_path,
+        releases={},
+    )
+
+    assert (
+        aiidalab_app_data._requirements_satisfied(requirements_file, python_bin)
+        is satisfied
+    )
+
+
+def test_requirements_satisfied_lists_packages_again(
+    monkeypatch, tmp_path, installed_packages, python_bin
+):
+    """Test that packages removed since they were last listed are detected."""
+    requirements_file = tmp_path / "requirements.txt"
+    requirements_file.write_text("jupyter_client>=7\n")
+
+    aiidalab_app_data = _AiidaLabApp(
+        metadata={},
+        name="test",
+        path=tmp_path,
+        releases={},
+    )
+    assert aiidalab_app_data._requirements_satisfied(requirements_file, python_bin)
+
+    monkeypatch.setattr(
+        "aiidalab.utils._pip_list",
+        lambda _: [{"name": "aiida-core", "version": "2.2.1"}],
+    )
+    assert not aiidalab_app_data._requirements_satisfied(requirements_file, python_bin)
@@ -0,0 +1,44 @@
+import pytest
+
+from aiidalab.environment import Environment
+
+
+def test_scan_setup_cfg(static_path):
+    """Test that requirements are parsed from the setup.cfg file."""
+    environment = Environment.scan(static_path / "app_with_setupcfg")
+    assert environment.python_requirements == [
+        "pip",
+        "pytest # This comment makes this requirement invalid",
+    ]
+
+
+def test_scan_requirements_txt_fallback(tmp_path):
+    """Test fallback to requirements.txt if setup.cfg has no requirements."""
+    tmp_path.joinpath("setup.cfg").write_text("[metadata]\nname = test\n")
+    tmp_path.joinpath("requirements.txt").write_text("# comment\naiida-core~=2.0\n")
+    environment = Environment.scan(tmp_path)
+    assert environment.python_requirements == ["aiida-core~=2.0"]
+
+
+def test_scan_empty(tmp_path):
+    """Test that scanning an app without environment specification succeeds."""
+    assert Environment.scan(tmp_path) == Environment()
+
+
+@pytest.mark.parametrize(
+    "setup_cfg",
+    [
+        "[options]\ninstall_requires =\n    aiida-core~=2.0\n    pip\n",
+        "[options]\ninstall_requires = aiida-core~=2.0\n    pip\n",
+        "[options]\nextras_require = x[y]\ninstall_requires =\n    aiida-core~=2.0\n    pip\n",
+        "[options]\npackages = find:\ninstall_requires =\n\taiida-core~=2.0\n\n\tpip\n[metadata]\nname = test\n",
+        "[options]\nInstall_Requires =\n    aiida-core~=2.0\n    pip\n",
+        "[options]\ninstall_requires =\n    aiida-core~=2.0\n    ; comment\n    pip\n",
+        "[DEFAULT]\nversion = 2.0\n[options]\ninstall_requires =\n    aiida-core~=%(version)s\n    pip\n",
+    ],
+)
+def test_scan_setup_cfg_layouts(tmp_path, setup_cfg):
+    """Test that requirements are parsed independent of the setup.cfg layout."""
+    tmp_path.joinpath("setup.cfg").write_text(setup_cfg)
+    environment = Environment.scan(tmp_path)
+    assert environment.python_requirements == ["aiida-core~=2.0", "pip"]
@@ -0,0 +1,211 @@
+import io
+import os
+import shutil
+import tarfile
+import zipfile
+
+import pytest
+
+from aiidalab.fetch import fetch_from_url
+
+
+def _tar_archive(files):
+    buffer = io.BytesIO()
+    with tarfile.open(fileobj=buffer, mode="w:gz") as tar_file:
+        for name, content in files.items():
+            info = tarfile.TarInfo(name)
+            info.size = len(content)
+            tar_file.addfile(info, io.BytesIO(content))
+    return buffer.getvalue()
+
+
+def _zip_archive(files):
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, mode="w") as zip_file:
+        for name, content in files.items():
+            zip_file.writestr(name, content)
+    return buffer.getvalue()
+
+
+@pytest.mark.parametrize("make_archive", [_tar_archive, _zip_archive])
+def test_fetch_from_path(tmp_path, make_archive):
+    archive = tmp_path / "app.archive"
+    archive.write_bytes(make_archive({"app/setup.cfg": b"[metadata]\n"}))
+
+    with fetch_from_url(str(archive)) as path:
+        assert path.joinpath("setup.cfg").read_bytes() == b"[metadata]\n"
+
+
+def test_fetch_from_path_cached(monkeypatch, tmp_path, extracted_archives_cache):
+    archive = tmp_path / "app.tar.gz"
+    archive.write_bytes(_tar_archive({"app/setup.cfg": b"[metadata]\n"}))
+
+    with fetch_from_url(str(archive)) as path:
+        assert path.is_relative_to(extracted_archives_cache)
+
+    # The same archive must not be extracted again.
+    def _extract_archive(*args):
+        raise AssertionError("Archive extracted again.")
+
+    monkeypatch.setattr("aiidalab.fetch._extract_archive", _extract_archive)
+    with fetch_from_url(str(archive)) as cached_path:
+        assert cached_path == path
+        assert cached_path.joinpath("setup.cfg").read_bytes() == b"[metadata]\n"
+
+
+def test_fetch_from_path_incomplete_cache_entry(tmp_path, extracted_archives_cache):
+    archive = tmp_path / "app.tar.gz"
+    archive.write_bytes(_tar_archive({"app/setup.cfg": b"[metadata]\n"}))
+
+    with fetch_from_url(str(archive)) as path:
+        pass
+    extracted = path.parent
+    extracted.with_name(f"{extracted.name}.complete").unlink()
+    path.joinpath("setup.cfg").unlink()
+
+    # Entries without completion marker must be extracted again.
+    with fetch_from_url(str(archive)) as path:
+        assert path.joinpath("setup.cfg").read_bytes() == b"[metadata]\n"
+    assert extracted.with_name(f"{extracted.name}.complete").is_file()
+
+
+def test_fetch_from_path_cache_pruned(monkeypatch, tmp_path, extracted_archives_cache):
+    monkeypatch.setattr("aiidalab.fetch._EXTRACTED_ARCHIVES_CACHE_SIZE", 2)
+    paths = []
+    for i in range(3):
+        archive = tmp_path / f"app-{i}.tar.gz"
+        archive.write_bytes(_tar_archive({"app/version": str(i).encode()}))
+        with fetch_from_url(str(archive)) as path:
+            paths.append(path)
+        # Mark the archive as used i seconds after the epoch.
+        marker = path.parent.with_name(f"{path.parent.name}.complete")
+        os.utime(marker, (i, i))
+
+    # Only the most recently used archives are kept.
+    assert not paths[0].exists()
+    assert all(path.exists() for path in paths[1:])
+    assert len(list(extracted_archives_cache.glob("*.complete"))) == 2
+
+
+def test_fetch_from_path_cache_in_use(monkeypatch, tmp_path):
+    monkeypatch.setattr("aiidalab.fetch._EXTRACTED_ARCHIVES_CACHE_SIZE", 1)
+    archives = []
+    for i in range(2):
+        archives.append(tmp_path / f"app-{i}.tar.gz")
+        archives[i].write_bytes(_tar_archive({"app/version": str(i).encode()}))
+
+    with fetch_from_url(str(archives[0])) as path:
+        with fetch_from_url(str(archives[1])) as other_path:
+            pass
+        # Archives that are in use must not be pruned.
+        assert path.joinpath("version").read_bytes() == b"0"
+    assert other_path.exists()
+
+
+def test_fetch_from_path_invalid_archive(tmp_path, extracted_archives_cache):
+    archive = tmp_path / "app.archive"
+    archive.write_bytes(b"not an archive")
+
+    with pytest.raises(RuntimeError, match="Failed to extract archive"):
+        with fetch_from_url(str(archive)):
+            pass
+    assert not any(extracted_archives_cache.iterdir())
+
+
+@pytest.mark.registry  # requires requests-mock
+def test_fetch_from_https(requests_mock):
+    url = "https://example.com/app.tar.gz"
+    requests_mock.get(url, content=_tar_archive({"app/setup.cfg": b"[metadata]\n"}))
+
+    with fetch_from_url(url) as path:
+        assert path.joinpath("setup.cfg").read_bytes() == b"[metadata]\n"
+
+
+@pytest.mark.registry  # requires requests-mock
+def test_fetch_from_https_revalidates_cached_archive(requests_mock):
+    url = "https://example.com/app.tar.gz"
+    requests_mock.get(
+        url,
+        [
+            {
+                "content": _tar_archive({"app/setup.cfg": b"[metadata]\n"}),
+                "headers": {"ETag": '"v1"'},
+            },
+            {"status_code": 304, "headers": {"ETag": '"v1"'}},
+        ],
+    )
+
+    for _ in range(2):
+        with fetch_from_url(url) as path:
+            assert path.joinpath("setup.cfg").read_bytes() == b"[metadata]\n"
+
+    assert requests_mock.call_count == 2
+    assert "If-None-Match" not in requests_mock.request_history[0].headers
+    assert requests_mock.last_request.headers["If-None-Match"] == '"v1"'
+
+
+@pytest.mark.registry  # requires requests-mock
+def test_fetch_from_https_without_validators(requests_mock, extracted_archives_cache):
+    url = "https://example.com/app.tar.gz"
+    requests_mock.get(url, content=_tar_archive({"app/setup.cfg": b"[metadata]\n"}))
+
+    for _ in range(2):
+        with fetch_from_url(url) as path:
+            assert path.joinpath("setup.cfg").read_bytes() == b"[metadata]\n"
+
+    # Without validators, the archive is not revalidated, but downloaded again.
+    assert "If-None-Match" not in requests_mock.last_request.headers
+    assert not extracted_archives_cache.joinpath("urls").exists()
+
+
+@pytest.mark.registry  # requires requests-mock
+def test_fetch_from_https_cached_archive_removed(requests_mock):
+    url = "https://example.com/app.tar.gz"
+    content = _tar_archive({"app/setup.cfg": b"[metadata]\n"})
+
+    def _remove_cached_archive(request, context):
+        shutil.rmtree(path.parent)
+        return b""
+
+    requests_mock.get(
+        url,
+        [
+            {"content": content, "headers": {"ETag": '"v1"'}},
+            {"status_code": 304, "content": _remove_cached_archive},
+            {"content": content, "headers": {"ETag": '"v1"'}},
+        ],
+    )
+
+    with fetch_from_url(url) as path:
+        pass
+    # The archive is removed while it is revalidated and must be downloaded again.
+    with fetch_from_url(url) as path:
+        assert path.joinpath("setup.cfg").read_bytes() == b"[metadata]\n"
+
+    assert requests_mock.call_count == 3
+    assert "If-None-Match" not in requests_mock.last_request.headers
+
+
+@pytest.mark.registry  # requires requests-mock
+@pytest.mark.parametrize(
+    "validators",
+    ['{"etag": "\\"v1\\""}', '{"sha256": "..", "etag": "\\"v1\\""}', "[]", '{"sha'],
+)
+def test_fetch_from_https_malformed_validators(
+    requests_mock, extracted_archives_cache, validators
+):
+    url = "https://example.com/app.tar.gz"
+    requests_mock.get(
+        url,
+        content=_tar_archive({"app/setup.cfg": b"[metadata]\n"}),
+        headers={"ETag": '"v1"'},
+    )
+    with fetch_from_url(url):
+        pass
+    (validators_path,) = extracted_archives_cache.joinpath("urls").iterdir()
+    validators_path.write_text(validators)
+
+    # Malformed validators are ignored, i.e., the archive is downloaded again.
+    with fetch_from_url(url) as path:
+        assert path.joinpath("setup.cfg").read_bytes() == b"[metadata]\n"
+    assert "If-None-Match" not in requests_mock.last_request.headers
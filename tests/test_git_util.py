@@ -0,0 +1,272 @@
+import os
+from pathlib import Path
+from subprocess import CalledProcessError
+
+import pytest
+
+from aiidalab.git_util import (
+    BranchTrackingStatus,
+    GitManagedAppRepo,
+    GitPath,
+    GitRepo,
+    _find_reachable_commits,
+)
+
+
+@pytest.mark.parametrize("commit", ["main", "sha"])
+def test_git_path(git_repo_path, commit, git):
+    """Test that GitPath operates on the objects of a given commit."""
+    if commit == "sha":
+        commit = git("rev-parse", "HEAD", cwd=git_repo_path)
+    root = GitPath(git_repo_path, commit)
+
+    assert root.is_dir()
+    assert root.joinpath("src").is_dir()
+    assert root.joinpath("setup.cfg").is_file()
+    assert not root.joinpath("missing").is_file()
+    assert not root.joinpath("missing").is_dir()
+    assert root.joinpath("setup.cfg").read_text() == "[metadata]\nname = test\n"
+    with pytest.raises(FileNotFoundError):
+        root.joinpath("missing").read_bytes()
+
+
+def test_git_path_revision_expression(git_repo_path, git):
+    """Test that GitPath supports revision expressions such as main~1."""
+    git_repo_path.joinpath("new.txt").write_text("new")
+    git("add", "new.txt", cwd=git_repo_path)
+    git("commit", "-m", "Add new file", cwd=git_repo_path)
+
+    assert GitPath(git_repo_path, "main").joinpath("new.txt").is_file()
+    root = GitPath(git_repo_path, "main~1")
+    assert root.is_dir()
+    assert not root.joinpath("new.txt").is_file()
+    assert root.joinpath("setup.cfg").read_text() == "[metadata]\nname = test\n"
+    assert not GitPath(git_repo_path, "main~5").is_dir()
+    with pytest.raises(ValueError, match="Unknown commit"):
+        GitPath(git_repo_path, "main~5").joinpath("setup.cfg").read_bytes()
+
+
+def test_git_path_resolve(git_repo_path):
+    git_path = GitPath(str(git_repo_path), "main").joinpath("src", "..", "setup.cfg")
+    assert git_path.repo == git_repo_path
+    assert git_path.resolve() == GitPath(git_repo_path, "main", Path("setup.cfg"))
+    assert os.fspath(git_path.resolve()) == str(git_repo_path / "setup.cfg")
+
+
+def test_git_path_annotated_tag(git_repo_path, git):
+    """Test that annotated tags are resolved to the tagged commit."""
+    git("tag", "-a", "v1.0.1", "-m", "Release v1.0.1", cwd=git_repo_path)
+    root = GitPath(git_repo_path, "refs/tags/v1.0.1")
+    assert root.joinpath("src").is_dir()
+    assert root.joinpath("src", "module.py").read_bytes() == b""
+
+
+def test_git_path_unknown_commit(git_repo_path):
+    with pytest.raises(ValueError, match="Unknown commit"):
+        GitPath(git_repo_path, "unknown").joinpath("setup.cfg").read_bytes()
+
+
+def test_git_path_cached_lookups_immutable(git_repo_path, git):
+    """Test that lookups for a commit id are not affected by later commits."""
+    commit = git("rev-parse", "HEAD", cwd=git_repo_path)
+    setup_cfg = GitPath(git_repo_path, commit).joinpath("setup.cfg")
+    assert setup_cfg.read_text() == "[metadata]\nname = test\n"
+
+    git_repo_path.joinpath("setup.cfg").write_text("[metadata]\nname = changed\n")
+    git("commit", "-am", "Change name", cwd=git_repo_path)
+
+    assert setup_cfg.read_text() == "[metadata]\nname = test\n"
+    assert (
+        GitPath(git_repo_path, "main").joinpath("setup.cfg").read_text()
+        == "[metadata]\nname = changed\n"
+    )
+
+
+def test_git_path_failed_lookups_not_cached(git_repo_path, tmp_path, git, commit_file):
+    """Test that a commit id that is unknown at first is found once fetched."""
+    clone_path = tmp_path / "clone"
+    git("clone", str(git_repo_path), str(clone_path), cwd=tmp_path)
+    commit_file(git_repo_path, "new.txt")
+    commit = git("rev-parse", "HEAD", cwd=git_repo_path)
+
+    new_file = GitPath(clone_path, commit).joinpath("new.txt")
+    assert not new_file.is_file()
+
+    git("fetch", "origin", cwd=clone_path)
+    assert new_file.is_file()
+    assert new_file.read_text() == "new.txt"
+
+
+def test_git_repo_get_current_branch(git_repo_path, git):
+    assert GitRepo(str(git_repo_path)).get_current_branch() == "main"
+
+    git("checkout", "--detach", cwd=git_repo_path)
+    with pytest.raises(RuntimeError, match="detached HEAD"):
+        GitRepo(str(git_repo_path)).get_current_branch()
+
+
+def test_git_repo_ref_from_rev(git_repo_path):
+    repo = GitRepo(str(git_repo_path))
+    assert repo.ref_from_rev("main") == "refs/heads/main"
+    assert repo.ref_from_rev("v1.0.0") == "refs/tags/v1.0.0"
+    assert repo.ref_from_rev("abc123") == "abc123"
+
+
+def test_git_repo_get_merged_tags(git_repo_path, git, commit_file):
+    repo = GitRepo(str(git_repo_path))
+    assert list(repo.get_merged_tags("main")) == ["v1.0.0"]
+
+    # Tags on commits that are not part of the branch are not merged.
+    git("checkout", "-b", "feature", cwd=git_repo_path)
+    commit_file(git_repo_path, "feature.txt")
+    git("tag", "v2.0.0a0", cwd=git_repo_path)
+    assert list(repo.get_merged_tags("main")) == ["v1.0.0"]
+    assert list(repo.get_merged_tags("feature")) == ["v1.0.0", "v2.0.0a0"]
+
+    with pytest.raises(ValueError, match="Not a branch"):
+        list(repo.get_merged_tags("missing"))
+
+
+def test_git_repo_get_merged_tag_commits(git_repo_path):
+    repo = GitRepo(str(git_repo_path))
+    assert list(repo.get_merged_tag_commits("main")) == [
+        ("v1.0.0", repo.get_commit_for_tag("v1.0.0"))
+    ]
+
+
+def test_find_reachable_commits_deepened(git_repo_path, tmp_path, git, commit_file):
+    """Test that cached reachability is updated when a shallow clone is deepened."""
+    initial_commit = git("rev-parse", "HEAD", cwd=git_repo_path).encode()
+    commit_file(git_repo_path, "new.txt")
+    clone_path = tmp_path / "clone"
+    git(
+        "clone",
+        "--depth=1",
+        f"file://{git_repo_path}",
+        str(clone_path),
+        cwd=tmp_path,
+    )
+    repo = GitRepo(str(clone_path))
+    tip = repo.head()
+    commits = frozenset([initial_commit])
+    assert _find_reachable_commits(repo, tip, commits) == frozenset()
+
+    # The repository is opened again, as it would be for a later operation.
+    git("fetch", "--unshallow", cwd=clone_path)
+    repo = GitRepo(str(clone_path))
+    assert _find_reachable_commits(repo, tip, commits) == commits
+
+
+def test_git_repo_rev_list(git_repo_path, git, commit_file):
+    repo = GitRepo(str(git_repo_path))
+    assert repo.rev_list("v1.0.0..main") == []
+
+    commit_file(git_repo_path, "new.txt")
+    assert repo.rev_list("v1.0.0..main") == [
+        git("rev-parse", "HEAD", cwd=git_repo_path)
+    ]
+
+    with pytest.raises(CalledProcessError):
+        repo.rev_list("v1.0.0..missing")
+
+
+def test_git_repo_clone_from_url(git_repo_path, tmp_path, git):
+    repo = GitRepo.clone_from_url(
+        git_repo_path.as_uri(), str(tmp_path.joinpath("clone"))
+    )
+    assert Path(repo.path).joinpath("setup.cfg").is_file()
+    assert repo.get_commit_for_tag("v1.0.0") == git(
+        "rev-parse", "v1.0.0", cwd=git_repo_path
+    )
+
+
+@pytest.mark.parametrize("rev", ["main", "v1.0.0"])
+def test_git_repo_clone_from_url_rev(git_repo_path, tmp_path, rev, git):
+    """Test that only the latest commit is cloned for a specific rev."""
+    git_repo_path.joinpath("setup.cfg").write_text("[metadata]\nname = changed\n")
+    git("commit", "-am", "Change name", cwd=git_repo_path)
+
+    repo = GitRepo.clone_from_url(
+        git_repo_path.as_uri(), str(tmp_path.joinpath("clone")), rev=rev
+    )
+    assert len(list(repo.get_walker())) == 1
+    assert GitPath(repo.path, repo.ref_from_rev(rev)).joinpath("setup.cfg").is_file()
+
+
+def test_git_repo_clone_from_url_commit(git_repo_path, tmp_path, git):
+    """Test that the full repository is cloned if the rev is a commit id."""
+    commit = git("rev-parse", "HEAD", cwd=git_repo_path)
+    repo = GitRepo.clone_from_url(
+        git_repo_path.as_uri(), str(tmp_path.joinpath("clone")), rev=commit
+    )
+    assert GitPath(repo.path, commit).joinpath("setup.cfg").is_file()
+
+
+def test_git_managed_app_repo_tracked_branch(app_repo_path, git):
+    repo = GitManagedAppRepo(str(app_repo_path))
+    assert repo.branch() == b"main"
+    assert repo.get_tracked_branch() == b"refs/remotes/origin/main"
+
+    # Changes to the config must be picked up.
+    git("branch", "--unset-upstream", cwd=app_repo_path)
+    assert repo.get_tracked_branch() is None
+
+
+def test_git_managed_app_repo_tracked_branch_worktree(app_repo_path, tmp_path, git):
+    path = tmp_path / "worktree"
+    git(
+        "worktree",
+        "add",
+        "--track",
+        "-b",
+        "feature",
+        str(path),
+        "origin/main",
+        cwd=app_repo_path,
+    )
+    repo = GitManagedAppRepo(str(path))
+    assert repo.branch() == b"feature"
+    assert repo.get_tracked_branch() == b"refs/remotes/origin/main"
+
+
+def test_git_managed_app_repo_dirty(app_repo_path, git):
+    repo = GitManagedAppRepo(str(app_repo_path))
+    assert not repo.dirty()
+
+    # Untracked files are ignored.
+    app_repo_path.joinpath("untracked.txt").write_text("untracked")
+    assert not repo.dirty()
+
+    git("add", "untracked.txt", cwd=app_repo_path)
+    assert repo.dirty()
+
+    git("reset", cwd=app_repo_path)
+    app_repo_path.joinpath("setup.cfg").write_text("[metadata]\nname = modified\n")
+    assert repo.dirty()
+
+
+def test_git_managed_app_repo_branch_detached(app_repo_path, git):
+    git("checkout", "--detach", cwd=app_repo_path)
+    with pytest.raises(RuntimeError, match="detached HEAD"):
+        GitManagedAppRepo(str(app_repo_path)).branch()
+
+
+def test_git_managed_app_repo_tracking_status(
+    git_repo_path, app_repo_path, git, commit_file
+):
+    repo = GitManagedAppRepo(str(app_repo_path))
+    assert repo.get_branch_tracking_status(b"main") is BranchTrackingStatus.EQUAL
+    assert not repo.update_available()
+
+    commit_file(git_repo_path, "remote.txt")
+    git("fetch", cwd=app_repo_path)
+    assert repo.get_branch_tracking_status(b"main") is BranchTrackingStatus.BEHIND
+    assert repo.update_available()
+
+    git("merge", "--ff-only", "origin/main", cwd=app_repo_path)
+    commit_file(app_repo_path, "local.txt")
+    assert repo.get_branch_tracking_status(b"main") is BranchTrackingStatus.AHEAD
+
+    commit_file(git_repo_path, "remote2.txt")
+    git("fetch", cwd=app_repo_path)
+    assert repo.get_branch_tracking_status(b"main") is BranchTrackingStatus.DIVERGED
@@ -0,0 +1,85 @@
+from configparser import DuplicateSectionError, MissingSectionHeaderError
+
+import pytest
+
+from aiidalab.metadata import Metadata, _map_development_state
+
+
+@pytest.mark.parametrize(
+    ("classifiers", "state"),
+    [
+        ("", "registered"),
+        ("Development Status :: 1 - Planning", "registered"),
+        ("\nDevelopment Status :: 3 - Alpha\nFramework :: AiiDA", "development"),
+        (["Development Status :: 5 - Production/Stable"], "stable"),
+        (
+            [
+                "Development Status :: 4 - Beta",
+                "Development Status :: 1 - Planning",
+            ],
+            "registered",
+        ),
+    ],
+)
+def test_map_development_state(classifiers, state):
+    assert _map_development_state(classifiers) == state
+
+
+def test_metadata_parse_state(tmp_path):
+    tmp_path.joinpath("setup.cfg").write_text(
+        "[metadata]\n"
+        "name = app\n"
+        "description = An app.\n"
+        "classifiers =\n"
+        "    Development Status :: 5 - Production/Stable\n"
+        "    Framework :: AiiDA\n"
+    )
+    assert Metadata.parse(tmp_path).state == "stable"
+
+
+def test_metadata_parse_cached_categories(tmp_path):
+    tmp_path.joinpath("setup.cfg").write_text(
+        "[metadata]\nname = app\ndescription = An app.\n\n"
+        "[aiidalab]\ncategories =\n    quantum\n"
+    )
+    metadata = Metadata.parse(tmp_path)
+    metadata.categories.append("modified")
+    assert Metadata.parse(tmp_path).categories == ["quantum"]
+
+
+def test_metadata_parse_without_metadata_sections(tmp_path):
+    tmp_path.joinpath("setup.cfg").write_text("[options]\npackages = find:\n")
+    assert Metadata._parse(tmp_path) == {"state": "registered", "categories": []}
+    assert Metadata._parse(tmp_path.joinpath("missing")) == {}
+
+
+def test_metadata_parse_ignores_unrelated_sections(tmp_path):
+    tmp_path.joinpath("setup.cfg").write_text(
+        "[options]\ninstall_requires =\n    [not-a-section]\n\n"
+        "[metadata]\nname = app\ndescription = An app.\n"
+        "[tool:pytest]\naddopts = %(invalid)s\n\n"
+        "[aiidalab]\ncategories =\n    quantum\n"
+    )
+    metadata = Metadata.parse(tmp_path)
+    assert metadata.description == "An app."
+    assert metadata.categories == ["quantum"]
+
+
+def test_metadata_parse_indented_section_header(tmp_path):
+    tmp_path.joinpath("setup.cfg").write_text(
+        "  [metadata]\n  name = app\n  description = An app.\n"
+    )
+    assert Metadata.parse(tmp_path).title == "app"
+
+
+@pytest.mark.parametrize(
+    ("setup_cfg", "error"),
+    [
+        ("[options]\n[options]\n[metadata]\nname = app\n", DuplicateSectionError),
+        ("name = app\n[metadata]\nname = app\n", MissingSectionHeaderError),
+    ],
+)
+def test_metadata_parse_invalid_unrelated_sections(tmp_path, setup_cfg, error):
+    tmp_path.joinpath("setup.cfg").write_text(setup_cfg)
+    with pytest.raises(error):
+        Metadata.parse(tmp_path)
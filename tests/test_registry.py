@@ -1,16 +1,24 @@
+import json
 import os
 
+import jsonschema
 import pytest
 
 from aiidalab.fetch import GitRepo, fetch_from_url
+from aiidalab.registry.api import build_api_v1
+from aiidalab.registry.apps_index import _migrate_app_data, generate_apps_index
+from aiidalab.registry.core import AppRegistryData, AppRegistrySchemas
+from aiidalab.registry.html import _get_environment, build_html
+from aiidalab.registry.releases import _get_release_commits, _split_release_line
+from aiidalab.registry.util import dump_json, get_hosted_on, load_json
+from aiidalab.registry.web import copy_static_tree_from_package
+from aiidalab.registry.yaml import loads
 
 pytestmark = pytest.mark.registry
 
 
 def test_get_all_tagged_releases():
     """Test that all tagged releases are returned."""
-    from aiidalab.registry.releases import _get_release_commits, _split_release_line
-
     url = "git+https://github.com/aiidalab/aiidalab-qe.git@*:v23.04.0^.."
     base_url, release_line = _split_release_line(url)
 
@@ -23,8 +31,6 @@ def test_get_all_tagged_releases():
 
 def test_get_releases_from_branch():
     """Test that all tagged releases of perticular branch (main) are returned."""
-    from aiidalab.registry.releases import _get_release_commits, _split_release_line
-
     url = "git+https://github.com/aiidalab/aiidalab-qe.git@main:v23.04.0^.."
     base_url, release_line = _split_release_line(url)
 
@@ -34,3 +40,148 @@ def test_get_releases_from_branch():
 
     assert "v23.04.2" not in releases
     assert "v23.04.0" in releases
+
+
+@pytest.mark.parametrize(
+    ("url", "hosted_on"),
+    [
+        ("https://github.com/aiidalab/aiidalab-qe", "github.com"),
+        ("git+https://gitlab.example.com:8080/app.git", "example.com"),
+        ("https://www.host.org?query", "host.org"),
+        ("//github.com/aiidalab/aiidalab-qe", "github.com"),
+    ],
+)
+def test_get_hosted_on(url, hosted_on):
+    assert get_hosted_on(url) == hosted_on
+
+
+def test_migrate_app_data():
+    """Test that app data is migrated without modifying the original data."""
+    app_data = {
+        "categories": ["quantum"],
+        "metadata": {"title": "App", "version": "1.0"},
+        "releases": ["git+https://example.com/app.git@main:"],
+    }
+    migrated = _migrate_app_data(app_data)
+
+    assert migrated == {
+        "metadata": {"title": "App", "categories": ["quantum"], "logo": None},
+        "releases": ["git+https://example.com/app.git@main:"],
+    }
+    assert app_data["categories"] == ["quantum"]
+    assert app_data["metadata"] == {"title": "App", "version": "1.0"}
+
+
+def test_dump_json(tmp_path):
+    """Test that registry data is written as JSON, including references."""
+    data = loads("a: {title: Über}\nb: {$ref: '#/a'}\n")
+    dump_json(data, tmp_path / "data.json")
+    assert json.loads(tmp_path.joinpath("data.json").read_text(encoding="utf-8")) == {
+        "a": {"title": "Über"},
+        "b": {"title": "Über"},
+    }
+
+
+def test_load_json(tmp_path):
+    """Test that UTF-8 encoded JSON files are loaded independent of the locale."""
+    dump_json({"title": "Über"}, tmp_path / "data.json")
+    assert load_json(tmp_path / "data.json") == {"title": "Über"}
+
+
+def test_build_api_v1(tmp_path):
+    """Test that the API endpoint files are written in order."""
+    apps_data = {f"app-{i}": {"name": f"app-{i}"} for i in range(20)}
+    apps_index = {"apps": {app_id: {} for app_id in apps_data}, "categories": {}}
+    outfiles = list(build_api_v1(tmp_path / "api", apps_index, apps_data))
+
+    assert outfiles == [tmp_path / "api" / "apps_index.json"] + [
+        tmp_path / "api" / "apps" / f"{app_id}.json" for app_id in apps_data
+    ]
+    for app_id, app_data in apps_data.items():
+        path = tmp_path / "api" / "apps" / f"{app_id}.json"
+        assert json.loads(path.read_text()) == app_data
+
+
+def test_build_api_v1_validates_apps(tmp_path):
+    """Test that invalid apps data is rejected before any file is written."""
+    schemas = AppRegistrySchemas.from_package()
+    apps_data = {"app": {"name": "app"}}
+    apps_index = {"apps": {"app": {}}, "categories": {}}
+    with pytest.raises(jsonschema.ValidationError):
+        list(build_api_v1(tmp_path / "api", apps_index, apps_data, schemas=schemas))
+    assert not tmp_path.joinpath("api").exists()
+
+
+def test_registry_schemas_from_package():
+    """Test that the package schemas are loaded once and shared."""
+    schemas = AppRegistrySchemas.from_package()
+    assert schemas.app["$schema"] == "http://json-schema.org/draft-07/schema#"
+    assert AppRegistrySchemas.from_package().app is schemas.app
+
+
+def test_registry_data_validate():
+    """Test that the registry data is validated with the cached validators."""
+    schemas = AppRegistrySchemas.from_package()
+    assert schemas.validators is schemas.validators
+    AppRegistryData(apps={}, categories={}).validate(schemas)
+    with pytest.raises(jsonschema.ValidationError):
+        AppRegistryData(apps=[], categories={}).validate(schemas)
+
+
+def test_generate_apps_index(tmp_path):
+    """Test that the apps index is sorted by app id and skips unreleased apps."""
+
+    def scan_app_repository(url):
+        return {"metadata": {}, "environment": {}}
+
+    app_ids = [f"app-{i}" for i in reversed(range(20))]
+    apps = {
+        app_id: {
+            "releases": [{"url": f"file:{tmp_path}", "version": "1.0.0"}],
+            "metadata": {"categories": ["utilities"]},
+        }
+        for app_id in app_ids
+    }
+    apps["unreleased"] = {"releases": [], "metadata": {}}
+    data = AppRegistryData(apps=apps, categories={"utilities": {}})
+
+    index, apps_data = generate_apps_index(data, scan_app_repository)
+    assert list(index["apps"]) == list(apps_data) == sorted(app_ids)
+    assert index["apps"]["app-0"] == {"name": "app-0", "categories": ["utilities"]}
+    assert list(apps_data["app-0"]["releases"]) == ["1.0.0"]
+
+
+def test_build_html(tmp_path):
+    """Test that the app subpages and the index page are written in order."""
+    apps_data = {
+        f"app-{i}": {"metadata": {"title": f"App {i}"}, "releases": {}}
+        for i in range(20)
+    }
+    apps_index = {"apps": {app_id: {} for app_id in apps_data}, "categories": {}}
+    outfiles = list(build_html(tmp_path / "html", apps_index, apps_data, None))
+
+    assert outfiles == [
+        tmp_path / "html" / "apps" / app_id / "index.html" for app_id in apps_data
+    ] + [tmp_path / "html" / "index.html"]
+    assert "App 7" in outfiles[7].read_text(encoding="utf-8")
+    assert "App 7" in outfiles[-1].read_text(encoding="utf-8")
+
+
+def test_build_html_environment_is_reused(tmp_path, templates_bytecode_cache):
+    """Test that the template environment is only set up once per templates path."""
+    env = _get_environment(None, templates_bytecode_cache)
+    assert env is _get_environment(None, templates_bytecode_cache)
+    assert _get_environment(tmp_path, templates_bytecode_cache) is not env
+
+    # The compiled templates are cached in the given directory.
+    env.get_template("index.html")
+    assert any(templates_bytecode_cache.iterdir())
+
+
+def test_copy_static_tree_from_package(tmp_path):
+    """Test that each static file of the package is copied exactly once."""
+    outfiles = list(copy_static_tree_from_package(tmp_path))
+    assert len(outfiles) == len(set(outfiles))
+    assert tmp_path / "static" / "css" / "style.css" in outfiles
+    assert tmp_path / "api" / "openapi-v1.yaml" in outfiles
+    assert all(outfile.is_file() for outfile in outfiles)
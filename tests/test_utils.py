@@ -1,6 +1,7 @@
 import pytest
 
-from aiidalab.utils import sort_semantic, split_git_url
+from aiidalab import json_util
+from aiidalab.utils import is_valid_version, sort_semantic, split_git_url
 
 
 @pytest.mark.parametrize(
@@ -40,6 +41,21 @@ def test_sort_semantic_descending(versions, sorted_versions):
     assert sort_semantic(versions) == sorted_versions
 
 
+def test_sort_semantic_iterator():
+    versions = ["2.0", "2.0.3", "1.0.0"]
+    assert sort_semantic(iter(versions)) == sort_semantic(versions)
+
+
+@pytest.mark.parametrize(
+    "version,valid",
+    [("1.0.0", True), ("2.0rc0", True), ("not-a-version", False)],
+)
+def test_is_valid_version(version, valid):
+    assert is_valid_version(version) is valid
+    # The result must not change once the version was parsed before.
+    assert is_valid_version(version) is valid
+
+
 @pytest.mark.parametrize(
     "url,base,ref",
     [
@@ -63,3 +79,13 @@ def test_split_git_url(url, base, ref):
     base_url, git_ref = split_git_url(url)
     assert base_url == base
     assert git_ref == ref
+
+
+@pytest.mark.skipif(json_util.orjson is None, reason="orjson is not installed")
+def test_json_dumps_without_orjson(monkeypatch):
+    """Test that the output does not depend on whether orjson is installed."""
+    data = {"title": "Über", "versions": ["1.0", "2.0"], "logo": None, "n": 1.5}
+    with_orjson = json_util.dumps(data)
+    monkeypatch.setattr(json_util, "orjson", None)
+    assert json_util.dumps(data) == with_orjson
+    assert json_util.loads(with_orjson) == data